@@ -1,5 +1,6 @@
 import sys
 import os
+import logging
 import subprocess
 from pathlib import Path
 
@@ -199,6 +200,11 @@ def run_application():
     Main application entry point with comprehensive error handling.
     """
     try:
+        # Per-frame diagnostics are logged at DEBUG; set AIFC_LOG_LEVEL=DEBUG to see them
+        logging.basicConfig(
+            level=os.getenv("AIFC_LOG_LEVEL", "WARNING").upper(),
+            format="%(levelname)s %(name)s: %(message)s"
+        )
         print_startup_info()
 
         # Check environment setup
@@ -223,10 +229,14 @@ def run_application():
         else:
             print("ℹ️ Skipping grader self-test (set AIFC_VALIDATE_GRADER=1 to enable).")
 
+        # Leave half the cores to MediaPipe's own thread pool and the Qt event loop
+        import cv2
+        cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+
         # Import Qt after dependency check
         from PySide6.QtWidgets import QApplication
         # Import MainWindow after the path has been adjusted
-        from src.gui.main_window import MainWindow
+        from src.gui.main_window import MainWindow, load_app_stylesheet
 
         print("✅ All checks passed! Launching GUI...")
 
@@ -235,6 +245,8 @@ def run_application():
         app.setApplicationName("AI Fitness Coach")
         app.setApplicationVersion("1.0.0")
         app.setOrganizationName("AI Fitness Coach")
+        # Set the theme before any widget exists so each one is polished once
+        app.setStyleSheet(load_app_stylesheet())
 
         # Set application icon if available
         icon_path = Path(__file__).parent / "resources" / "icon.png"
@@ -1,7 +1,10 @@
 # ai_fitness_coach/src/capture/camera.py
 import cv2
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 class CameraManager:
     """
     Unified camera manager that can handle both live camera and video files.
@@ -24,19 +27,66 @@ class CameraManager:
             if self.is_video_file:
                 raise RuntimeError(f"Cannot open video file: {source}")
             # For webcam sources, we don't throw an error, just log
-            print(f"⚠️  Warning: Cannot open camera {source} (camera may not be available)")
+            logger.warning("Cannot open camera %s (camera may not be available)", source)
+    
+    def configure_webcam(self, width=1280, height=720, fps=30, buffer_size=1, fourcc="MJPG"):
+        """
+        Configure a live camera for low latency. No-op for video files.
+        
+        FOURCC is set before the frame size and rate because USB 2.0 cameras
+        only reach 720p/1080p at full frame rate in MJPG (uncompressed YUY2
+        saturates the bus); a small driver buffer makes read() return the
+        freshest frame instead of one queued several frames ago.
+        """
+        if self.is_video_file or not self.isOpened():
+            return
+        
+        if fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps:
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+        self.set_buffer_size(buffer_size)
+    
+    def set_buffer_size(self, size):
+        """Limit how many frames the capture backend queues (not all backends honour this)."""
+        if self.isOpened():
+            return self.cap.set(cv2.CAP_PROP_BUFFERSIZE, size)
+        return False
     
-    def get_frame(self):
-        """Returns a BGR numpy.ndarray or None on read failure."""
+    def get_frame(self, out=None):
+        """
+        Returns a BGR numpy.ndarray or None on read failure.
+        
+        When out is a buffer of the right shape the frame is decoded into it
+        instead of a newly allocated array.
+        """
         if not self.isOpened():
             return None
         
-        ok, frame = self.cap.read()
+        ok, frame = self.cap.read(out) if out is not None else self.cap.read()
         if not ok:
             return None
             
         return frame
 
+    def grab_and_retrieve(self, skip=0, out=None):
+        """
+        Skips the next skip frames, then returns the one after as get_frame() does.
+        
+        Skipped frames are only grab()bed, which advances the demuxer without
+        decoding, so thinning out a high frame rate recording costs little.
+        """
+        if not self.isOpened():
+            return None
+        
+        for _ in range(skip):
+            if not self.cap.grab():
+                return None
+        
+        return self.get_frame(out)
+
     def isOpened(self):
         """Check if the camera or video file is opened."""
         return self.cap is not None and self.cap.isOpened()
@@ -67,9 +117,9 @@ class CameraManager:
             if self.cap:
                 self.cap.release()
                 self.cap = None
-                print("🔄 Camera resources released")
+                logger.debug("Camera resources released")
         except Exception as e:
-            print(f"Warning: Error releasing camera: {e}")
+            logger.warning("Error releasing camera: %s", e)
             
     def __del__(self):
         """Destructor to ensure resources are cleaned up."""
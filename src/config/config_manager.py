@@ -1,7 +1,11 @@
+import copy
 import json
+import logging
 import os
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 class ConfigManager:
     """Manages application configuration and user preferences"""
     
@@ -18,7 +22,14 @@ class ConfigManager:
                 "show_angles": True,
                 "show_skeleton": True,
                 "smoothing_frames": 5,
-                "min_frames_for_fault": 3
+                "min_frames_for_fault": 3,
+                "mediapipe_model_complexity": 0,
+                "skip_frames_base": 1,
+                "video_analysis_fps": 30,
+                "camera_buffer_size": 1,
+                "inference_max_side": 640,
+                "pose_backend": "cpu",
+                "pose_gpu_model_path": ""
             },
             "ui_settings": {
                 "window_width": 1600,
@@ -33,6 +44,8 @@ class ConfigManager:
             }
         }
         
+        # Parsed contents of config_file; read once, kept in sync by save_config
+        self._file_config = None
         self.ensure_config_exists()
     
     def ensure_config_exists(self):
@@ -43,27 +56,29 @@ class ConfigManager:
             self.save_config(self.default_config)
     
     def load_config(self):
-        """Load configuration from file"""
+        """Load configuration from file (parsed once, then served from memory)"""
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            if self._file_config is None:
+                with open(self.config_file, 'r') as f:
+                    self._file_config = json.load(f)
             
-            # Merge with defaults to ensure all keys exist
-            merged_config = self._merge_configs(self.default_config, config)
-            return merged_config
+            # Merge with defaults to ensure all keys exist; callers get their own copy
+            merged_config = self._merge_configs(self.default_config, self._file_config)
+            return copy.deepcopy(merged_config)
             
         except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"Error loading config: {e}. Using defaults.")
-            return self.default_config.copy()
+            logger.warning("Error loading config: %s. Using defaults.", e)
+            return copy.deepcopy(self.default_config)
     
     def save_config(self, config):
         """Save configuration to file"""
         try:
             with open(self.config_file, 'w') as f:
                 json.dump(config, f, indent=2)
+            self._file_config = copy.deepcopy(config)
             return True
         except Exception as e:
-            print(f"Error saving config: {e}")
+            logger.error("Error saving config: %s", e)
             return False
     
     def _merge_configs(self, default, user):
@@ -118,11 +133,13 @@ class ConfigManager:
             config = self.load_config()
             if 'ui' not in config:
                 config['ui'] = {}
+            elif all(config['ui'].get(key) == value for key, value in serializable_settings.items()):
+                return True  # Unchanged, skip rewriting the file
             config['ui'].update(serializable_settings)
             return self.save_config(config)
             
         except Exception as e:
-            print(f"Warning: Could not save UI settings: {e}")
+            logger.warning("Could not save UI settings: %s", e)
             return False
     
     def reset_to_defaults(self):
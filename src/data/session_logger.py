@@ -92,12 +92,9 @@ class DataLogger:
         self.current_difficulty_level = "beginner"
         self.difficulty_changes = []  # Track difficulty changes during session
         
-        print(f"✅ Data logging system initialized with difficulty tracking")
-        print(f"   Output directory: {self.config.base_output_dir}")
-        print(f"   Frame logging: {self.config.log_frame_level}")
-        print(f"   Rep logging: {self.config.log_rep_level}")
-        print(f"   Session logging: {self.config.log_session_level}")
-        print(f"   Difficulty tracking: Enabled")
+        logger.info("Data logging system initialized (output: %s, frame: %s, rep: %s, session: %s)",
+                    self.config.base_output_dir, self.config.log_frame_level,
+                    self.config.log_rep_level, self.config.log_session_level)
     
     def _setup_directories(self):
         """Create all necessary directories for data logging"""
@@ -245,7 +242,7 @@ class DataLogger:
         self.eval_rep_buffer = []
         self.eval_cue_buffer = []
         
-        print(f"📊 Data logging session started: {self.current_session_id}")
+        logger.info("Data logging session started: %s", self.current_session_id)
         return self.current_session_id
     
     def log_difficulty_change(self, new_difficulty: str, rep_number: int = None, 
@@ -269,7 +266,7 @@ class DataLogger:
         
         self.difficulty_changes.append(change_record)
         
-        print(f"🎯 Difficulty changed: {old_difficulty} → {new_difficulty} (Rep {change_record['rep_number']})")
+        logger.info("Difficulty changed: %s -> %s (Rep %s)", old_difficulty, new_difficulty, change_record['rep_number'])
         
         # Update session data with latest difficulty
         if self.session_data_buffer:
@@ -476,9 +473,9 @@ class DataLogger:
         if self.config.auto_cleanup:
             self._cleanup_old_data()
         
-        print(f"📊 Session completed: {completed_reps} reps, {len(self.frame_data_buffer)} frames analyzed")
-        print(f"   Session quality: {session_data['session_quality_score']:.1f}/100")
-        print(f"   Average form score: {avg_score:.1f}/100")
+        logger.info("Session completed: %d reps, %d frames analyzed, quality %.1f/100, average form %.1f/100",
+                    completed_reps, len(self.frame_data_buffer),
+                    session_data['session_quality_score'], avg_score)
         
         # Reset for next session
         self.current_session_id = None
@@ -771,10 +768,11 @@ class DataLogger:
             if not file_exists:
                 writer.writeheader()
             
-            for session_data in self.session_data_buffer:
-                # Ensure all schema fields are present
-                row_data = {field: session_data.get(field, '') for field in self.session_schema}
-                writer.writerow(row_data)
+            # Ensure all schema fields are present
+            writer.writerows(
+                {field: session_data.get(field, '') for field in self.session_schema}
+                for session_data in self.session_data_buffer
+            )
     
     def _write_rep_data(self):
         """Write rep data to CSV file"""
@@ -795,9 +793,10 @@ class DataLogger:
             if not file_exists:
                 writer.writeheader()
             
-            for rep_data in self.rep_data_buffer:
-                row_data = {field: rep_data.get(field, '') for field in self.rep_schema}
-                writer.writerow(row_data)
+            writer.writerows(
+                {field: rep_data.get(field, '') for field in self.rep_schema}
+                for rep_data in self.rep_data_buffer
+            )
     
     def _write_biomech_data(self):
         """Write frame-level biomechanical data to CSV file"""
@@ -818,9 +817,10 @@ class DataLogger:
             if not file_exists:
                 writer.writeheader()
             
-            for frame_data in self.frame_data_buffer:
-                row_data = {field: frame_data.get(field, '') for field in self.biomech_schema}
-                writer.writerow(row_data)
+            writer.writerows(
+                {field: frame_data.get(field, '') for field in self.biomech_schema}
+                for frame_data in self.frame_data_buffer
+            )
     
     def _write_ml_training_data(self):
         """Write ML training dataset to CSV file"""
@@ -841,13 +841,18 @@ class DataLogger:
             if not file_exists:
                 writer.writeheader()
             
-            # Create ML training records by combining frame and rep data
-            for frame_data in self.frame_data_buffer:
-                rep_data = next((r for r in self.rep_data_buffer if r['rep_id'] == frame_data['rep_id']), {})
-                session_data = self.session_data_buffer[0] if self.session_data_buffer else {}
-                
-                ml_record = self._create_ml_training_record(frame_data, rep_data, session_data)
-                writer.writerow(ml_record)
+            # Create ML training records by combining frame and rep data; reps are
+            # looked up by id (first match wins) instead of scanned per frame
+            reps_by_id = {}
+            for r in self.rep_data_buffer:
+                reps_by_id.setdefault(r['rep_id'], r)
+            session_data = self.session_data_buffer[0] if self.session_data_buffer else {}
+            
+            writer.writerows(
+                self._create_ml_training_record(
+                    frame_data, reps_by_id.get(frame_data['rep_id'], {}), session_data)
+                for frame_data in self.frame_data_buffer
+            )
     
     def _create_ml_training_record(self, frame_data: Dict, rep_data: Dict, session_data: Dict) -> Dict:
         """Create a comprehensive ML training record"""
@@ -1789,7 +1794,7 @@ class DataLogger:
         # Initialize CSV files in flat structure (same as other logs)
         self._init_evaluation_files(eval_dir)
         
-        print(f"🎯 Evaluation session started for {user_name}")
+        logger.info("Evaluation session started for %s", user_name)
         return self._evaluation_context['session_id']
     
     def _init_evaluation_files(self, eval_dir):
@@ -1939,12 +1944,10 @@ class DataLogger:
             'total_cues': self._evaluation_context['cue_count']
         }
         
-        print(f"✅ Evaluation session finalized:")
-        print(f"   User: {self._evaluation_context['user_name']}")
-        print(f"   Frames logged: {self._evaluation_context['frame_count']}")
-        print(f"   Reps logged: {self._evaluation_context['rep_count']}")
-        print(f"   Cues logged: {self._evaluation_context['cue_count']}")
-        print(f"   Duration: {metadata['duration_seconds']:.1f}s")
+        logger.info("Evaluation session finalized: user %s, %d frames, %d reps, %d cues, %.1fs",
+                    self._evaluation_context['user_name'], self._evaluation_context['frame_count'],
+                    self._evaluation_context['rep_count'], self._evaluation_context['cue_count'],
+                    metadata['duration_seconds'])
         
         # Clean up evaluation context
         delattr(self, '_evaluation_context')
@@ -2007,6 +2010,4 @@ class DataLogger:
                 writer.writerow(schema)
             
             # Write data rows
-            for record in data_buffer:
-                row = [record.get(field, '') for field in schema]
-                writer.writerow(row)
+            writer.writerows([record.get(field, '') for field in schema] for record in data_buffer)
@@ -6,6 +6,7 @@ intelligent message selection, and adaptive feedback based on user context.
 Maintains backward compatibility while adding advanced features.
 """
 
+import logging
 import time
 from collections import deque
 from typing import Dict, List, Optional, Any, Union
@@ -21,6 +22,8 @@ from .feedback_types import (
 from .voice_engine import VoiceFeedbackEngine
 from .message_templates import MessageTemplateManager
 
+logger = logging.getLogger(__name__)
+
 class EnhancedFeedbackManager:
     """Enhanced feedback manager with voice support and intelligent messaging
     
@@ -68,9 +71,8 @@ class EnhancedFeedbackManager:
             'session_start_time': time.time()
         }
         
-        print(f"✅ Enhanced feedback manager initialized")
-        print(f"   Voice enabled: {self.voice_engine.is_available()}")
-        print(f"   User skill level: {user_skill_level}")
+        logger.info("Enhanced feedback manager initialized (voice enabled: %s, skill level: %s)",
+                    self.voice_engine.is_available(), user_skill_level)
     
     def add_feedback(self, message: str, priority: int = 2, 
                     category: str = "general", duration: float = 3.0) -> bool:
@@ -492,4 +494,4 @@ class EnhancedFeedbackManager:
         """Gracefully shutdown the feedback system"""
         if self.voice_engine:
             self.voice_engine.shutdown()
-        print("✅ Enhanced feedback manager shutdown complete")
+        logger.info("Enhanced feedback manager shutdown complete")
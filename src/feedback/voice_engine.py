@@ -5,12 +5,15 @@ This module handles text-to-speech functionality with intelligent voice manageme
 queue processing, and adaptive voice settings based on feedback context.
 """
 
+import logging
 import threading
 import queue
 import time
 from typing import Optional, Dict, Any
 from .feedback_types import FeedbackStyle, EnhancedFeedbackMessage
 
+logger = logging.getLogger(__name__)
+
 class VoiceFeedbackEngine:
     """Voice feedback engine with intelligent TTS management"""
     
@@ -74,14 +77,15 @@ class VoiceFeedbackEngine:
                     if key not in config:
                         config[key] = default_value
                 
-                print(f"✅ Loaded voice config: {config['voice_name']} (Rate: {config['rate']}, Volume: {config['volume']})")
+                logger.info("Loaded voice config: %s (Rate: %s, Volume: %s)",
+                            config['voice_name'], config['rate'], config['volume'])
                 return config
             else:
-                print("⚠️ No voice config found, using defaults")
+                logger.info("No voice config found, using defaults")
                 return default_config
                 
         except Exception as e:
-            print(f"⚠️ Error loading voice config: {e}, using defaults")
+            logger.warning("Error loading voice config: %s, using defaults", e)
             return default_config
     
     def _initialize_engine(self):
@@ -92,7 +96,7 @@ class VoiceFeedbackEngine:
             # First, try to use PowerShell TTS (our working solution)
             if self._test_powershell_tts():
                 self.use_powershell = True
-                print("✅ Voice feedback engine initialized with PowerShell TTS")
+                logger.info("Voice feedback engine initialized with PowerShell TTS")
                 self._start_speech_worker()
                 return
             
@@ -118,14 +122,13 @@ class VoiceFeedbackEngine:
             # Start the speech worker thread
             self._start_speech_worker()
             
-            print("✅ Voice feedback engine initialized with pyttsx3")
+            logger.info("Voice feedback engine initialized with pyttsx3")
             
         except ImportError:
-            print("⚠️ pyttsx3 not installed. Voice feedback disabled.")
-            print("   Install with: pip install pyttsx3")
+            logger.warning("pyttsx3 not installed, voice feedback disabled (pip install pyttsx3)")
             self.enabled = False
         except Exception as e:
-            print(f"❌ Voice engine initialization failed: {e}")
+            logger.error("Voice engine initialization failed: %s", e)
             self.enabled = False
     
     def _test_powershell_tts(self) -> bool:
@@ -176,7 +179,7 @@ class VoiceFeedbackEngine:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
             return result.returncode == 0
         except Exception as e:
-            print(f"❌ PowerShell TTS failed: {e}")
+            logger.error("PowerShell TTS failed: %s", e)
             return False
     
     def _start_speech_worker(self):
@@ -224,7 +227,7 @@ class VoiceFeedbackEngine:
                     # Timeout occurred, continue loop
                     continue
                 except Exception as e:
-                    print(f"❌ Speech worker error: {e}")
+                    logger.error("Speech worker error: %s", e)
                     self.is_speaking = False
                     self.current_priority = 999
         
@@ -243,7 +246,7 @@ class VoiceFeedbackEngine:
             self.engine.setProperty('rate', settings['rate'])
             self.engine.setProperty('volume', settings['volume'])
         except Exception as e:
-            print(f"⚠️ Failed to apply voice settings: {e}")
+            logger.warning("Failed to apply voice settings: %s", e)
     
     def speak_message(self, feedback_message: EnhancedFeedbackMessage, force: bool = False):
         """Queue a feedback message for speech delivery
@@ -268,7 +271,7 @@ class VoiceFeedbackEngine:
             self.speech_queue.put(speech_item, timeout=0.1)
             return True
         except queue.Full:
-            print("⚠️ Voice feedback queue full - message dropped")
+            logger.debug("Voice feedback queue full - message dropped")
             return False
     
     def speak_immediate(self, message: str, style: FeedbackStyle = FeedbackStyle.INSTRUCTIONAL, priority: int = 1):
@@ -290,7 +293,7 @@ class VoiceFeedbackEngine:
                 self.engine.runAndWait()
             return True
         except Exception as e:
-            print(f"❌ Immediate speech failed: {e}")
+            logger.error("Immediate speech failed: %s", e)
             return False
     
     def _clean_message_for_speech(self, message: str) -> str:
@@ -397,4 +400,4 @@ class VoiceFeedbackEngine:
             if self.speech_thread and self.speech_thread.is_alive():
                 self.speech_thread.join(timeout=2.0)
             
-            print("✅ Voice feedback engine shutdown complete")
+            logger.info("Voice feedback engine shutdown complete")
@@ -21,6 +21,7 @@ import numpy as np
 import math
 import time
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
@@ -29,6 +30,30 @@ from collections import deque, defaultdict
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Per-thread cache of the rep currently being graded: (frame_metrics, length, {attribute: array})
+_column_cache = threading.local()
+
+
+def metric_column(frame_metrics, name: str) -> np.ndarray:
+    """
+    Returns attribute `name` of every frame as a float64 array.
+    
+    The analyzers all read the same few per-frame values of one rep; the
+    arrays are built once per rep and shared, so each reduction is a single
+    NumPy call instead of a Python pass over the frame list.
+    """
+    entry = getattr(_column_cache, 'entry', None)
+    if entry is None or entry[0] is not frame_metrics or entry[1] != len(frame_metrics):
+        entry = (frame_metrics, len(frame_metrics), {})
+        _column_cache.entry = entry
+    columns = entry[2]
+    column = columns.get(name)
+    if column is None:
+        column = np.fromiter((getattr(fm, name) for fm in frame_metrics),
+                             dtype=np.float64, count=len(frame_metrics))
+        columns[name] = column
+    return column
+
 @dataclass
 class ThresholdConfig:
     """
@@ -562,7 +587,7 @@ class BaseAnalyzer:
         if not frame_metrics or not self.required_landmarks:
             return True
             
-        avg_visibility = np.mean([fm.landmark_visibility for fm in frame_metrics])
+        avg_visibility = metric_column(frame_metrics, 'landmark_visibility').mean()
         return avg_visibility >= self.min_visibility_threshold
     
     def _check_difficulty(self, difficulty: str) -> bool:
@@ -610,15 +635,17 @@ class SafetyAnalyzer(BaseAnalyzer):
     
     def _analyze_consistent(self, frame_metrics: List[BiomechanicalMetrics]) -> Dict[str, Any]:
         """Core analysis with fixed thresholds"""
-        back_angles = [fm.back_angle for fm in frame_metrics if fm.back_angle > 0]
-        if not back_angles:
+        back_angles = metric_column(frame_metrics, 'back_angle')
+        back_angles = back_angles[back_angles > 0]
+        if back_angles.size == 0:
             return {'faults': [], 'penalties': [], 'bonuses': []}
         
-        min_back_angle = np.min(back_angles)
-        avg_back_angle = np.mean(back_angles)
+        min_back_angle = back_angles.min()
+        avg_back_angle = back_angles.mean()
         
         # Debug: Show actual back angle vs thresholds
-        print(f"🔧 BACK ANGLE DEBUG: min={min_back_angle:.1f}°, severe_thresh={self.SEVERE_BACK_ROUNDING_THRESHOLD:.1f}°, moderate_thresh={self.MODERATE_BACK_ROUNDING_THRESHOLD:.1f}°")
+        logger.debug("Back angle: min=%.1f°, severe_thresh=%.1f°, moderate_thresh=%.1f°",
+                     min_back_angle, self.SEVERE_BACK_ROUNDING_THRESHOLD, self.MODERATE_BACK_ROUNDING_THRESHOLD)
         
         faults = []
         penalties = []
@@ -629,13 +656,15 @@ class SafetyAnalyzer(BaseAnalyzer):
         if min_back_angle < self.SEVERE_BACK_ROUNDING_THRESHOLD:  # < 60° - very dangerous
             faults.append('SEVERE_BACK_ROUNDING')
             # Log the exact comparison for debugging
-            print(f"🔧 SAFETY DEBUG: Back angle {min_back_angle:.1f}° < SEVERE threshold {self.SEVERE_BACK_ROUNDING_THRESHOLD:.1f}° = SEVERE")
+            logger.debug("Back angle %.1f° < SEVERE threshold %.1f°",
+                         min_back_angle, self.SEVERE_BACK_ROUNDING_THRESHOLD)
             # More severe penalty for dangerous postures
             degrees_below = self.SEVERE_BACK_ROUNDING_THRESHOLD - min_back_angle
             # Scale penalty based on difficulty strictness - lower threshold = higher multiplier
             strictness_multiplier = 80.0 / self.SEVERE_BACK_ROUNDING_THRESHOLD  # Beginner ~1.0, Expert ~1.3
             penalty_amount = 40 + degrees_below * 2.0 * strictness_multiplier
-            print(f"🔧 SEVERE PENALTY DEBUG: degrees_below={degrees_below:.1f}, strictness={strictness_multiplier:.2f}, penalty={penalty_amount:.1f}")
+            logger.debug("Severe penalty: degrees_below=%.1f, strictness=%.2f, penalty=%.1f",
+                         degrees_below, strictness_multiplier, penalty_amount)
             penalties.append({
                 'reason': 'DANGER: Severe back rounding detected!', 
                 'amount': min(80, penalty_amount),  # Increased cap to allow for difficulty differences
@@ -650,7 +679,9 @@ class SafetyAnalyzer(BaseAnalyzer):
             # Higher strictness (lower threshold) = higher multiplier
             strictness_multiplier = 150.0 / self.MODERATE_BACK_ROUNDING_THRESHOLD  # Beginner ~1.1, Expert ~1.6
             penalty_amount = 15 + angle_deficit * 1.5 * strictness_multiplier
-            print(f"🔧 MODERATE PENALTY: angle={min_back_angle:.1f}°, threshold={self.MODERATE_BACK_ROUNDING_THRESHOLD:.1f}°, deficit={angle_deficit:.1f}, strictness={strictness_multiplier:.2f}, penalty={penalty_amount:.1f}")
+            logger.debug("Moderate penalty: angle=%.1f°, threshold=%.1f°, deficit=%.1f, strictness=%.2f, penalty=%.1f",
+                         min_back_angle, self.MODERATE_BACK_ROUNDING_THRESHOLD, angle_deficit,
+                         strictness_multiplier, penalty_amount)
             penalties.append({
                 'reason': 'Back rounding - keep chest up and spine neutral', 
                 'amount': min(70, penalty_amount),  # High cap to allow full difficulty range
@@ -772,12 +803,13 @@ class DepthAnalyzer(BaseAnalyzer):
         2. Partial rep (some depth but not enough)  
         3. Good depth (meets requirements, potential rewards)
         """
-        knee_angles = [fm.knee_angle_left for fm in frame_metrics if fm.knee_angle_left > 0]
-        if not knee_angles:
+        knee_angles = metric_column(frame_metrics, 'knee_angle_left')
+        knee_angles = knee_angles[knee_angles > 0]
+        if knee_angles.size == 0:
             return {'faults': [], 'penalties': [], 'bonuses': []}
 
-        min_knee_angle = np.min(knee_angles)
-        max_knee_angle = np.max(knee_angles)
+        min_knee_angle = knee_angles.min()
+        max_knee_angle = knee_angles.max()
         movement_range = max_knee_angle - min_knee_angle
         
         faults = []
@@ -1046,12 +1078,12 @@ class StabilityAnalyzer(BaseAnalyzer):
         if len(frame_metrics) < 10:
             return {'faults': [], 'penalties': [], 'bonuses': []}
         
-        com_x = [fm.center_of_mass_x for fm in frame_metrics]
-        com_y = [fm.center_of_mass_y for fm in frame_metrics]
+        com_x = metric_column(frame_metrics, 'center_of_mass_x')
+        com_y = metric_column(frame_metrics, 'center_of_mass_y')
         
         # Calculate total sway (standard deviation)
-        x_sway = np.std(com_x) if len(com_x) > 1 else 0
-        y_sway = np.std(com_y) if len(com_y) > 1 else 0
+        x_sway = com_x.std() if len(com_x) > 1 else 0
+        y_sway = com_y.std() if len(com_y) > 1 else 0
         total_sway = np.sqrt(x_sway**2 + y_sway**2)
         
         faults = []
@@ -1150,15 +1182,17 @@ class SymmetryAnalyzer(BaseAnalyzer):
         return difficulty in ['professional', 'expert']
     
     def analyze(self, frame_metrics: List[BiomechanicalMetrics]) -> Dict[str, Any]:
-        left_knee = [fm.knee_angle_left for fm in frame_metrics if fm.knee_angle_left > 0]
-        right_knee = [fm.knee_angle_right for fm in frame_metrics if fm.knee_angle_right > 0]
+        left_knee = metric_column(frame_metrics, 'knee_angle_left')
+        right_knee = metric_column(frame_metrics, 'knee_angle_right')
+        left_knee = left_knee[left_knee > 0]
+        right_knee = right_knee[right_knee > 0]
         
-        if not left_knee or not right_knee or len(left_knee) != len(right_knee):
+        if left_knee.size == 0 or right_knee.size == 0 or len(left_knee) != len(right_knee):
             return {'faults': [], 'penalties': [], 'bonuses': []}
         
         # Calculate symmetry ratio
-        symmetry_ratios = [min(l, r) / max(l, r) for l, r in zip(left_knee, right_knee)]
-        avg_symmetry = np.mean(symmetry_ratios)
+        symmetry_ratios = np.minimum(left_knee, right_knee) / np.maximum(left_knee, right_knee)
+        avg_symmetry = symmetry_ratios.mean()
         
         faults = []
         penalties = []
@@ -1531,6 +1565,23 @@ class IntelligentFormGrader:
     Provides comprehensive movement quality assessment with visibility-aware analysis.
     """
     
+    # Skill level implied by each difficulty, used for component weights
+    DIFFICULTY_SKILL_LEVELS = {
+        'beginner': UserLevel.BEGINNER,
+        'casual': UserLevel.INTERMEDIATE,  # Map casual to intermediate
+        'professional': UserLevel.ADVANCED,
+        'expert': UserLevel.EXPERT
+    }
+    
+    # difficulty -> (threshold multiplier, analyzer visibility threshold).
+    # Higher difficulty = stricter thresholds = lower scores for same performance
+    DIFFICULTY_SCALING = {
+        'beginner': (1.1, 0.6),       # Most forgiving: 10% more lenient (was 1.2)
+        'casual': (1.0, 0.7),         # Baseline: no change from config
+        'professional': (0.9, 0.8),   # 10% stricter (was 0.85)
+        'expert': (0.8, 0.85),        # Strictest: 20% stricter (was 0.7)
+    }
+    
     def __init__(self, user_profile: UserProfile = None, difficulty: str = "beginner", config: ThresholdConfig = None):
         """Initialize the intelligent form grader with configurable thresholds."""
         # Initialize logger first
@@ -1737,54 +1788,30 @@ class IntelligentFormGrader:
         difficulty = difficulty.lower()
         
         # UPDATED: Support 4 difficulty levels to match skill levels
-        valid_difficulties = ['beginner', 'casual', 'professional', 'expert']
-        
-        if difficulty not in valid_difficulties:
+        if difficulty not in self.DIFFICULTY_SKILL_LEVELS:
             logging.warning(f"Invalid difficulty '{difficulty}', defaulting to 'casual'")
             difficulty = 'casual'
         
         self.difficulty = difficulty
         
         # CRITICAL FIX: Map difficulty to user skill level for weight calculation
-        difficulty_to_skill = {
-            'beginner': UserLevel.BEGINNER,
-            'casual': UserLevel.INTERMEDIATE,  # Map casual to intermediate
-            'professional': UserLevel.ADVANCED,
-            'expert': UserLevel.EXPERT
-        }
+        skill_level = self.DIFFICULTY_SKILL_LEVELS[difficulty]
         
         # Update user profile skill level to match difficulty
         if self.user_profile:
-            self.user_profile.skill_level = difficulty_to_skill[difficulty]
+            self.user_profile.skill_level = skill_level
         
         self._update_difficulty_thresholds()
         
         # Update component weights based on new difficulty/skill level
         self.component_weights = self._get_skill_based_weights()
         
-        logger.debug(f"FormGrader: Difficulty updated to: {self.difficulty}, skill level: {difficulty_to_skill[difficulty]}")
+        logger.debug(f"FormGrader: Difficulty updated to: {self.difficulty}, skill level: {skill_level}")
     
     def _update_difficulty_thresholds(self) -> None:
         """Update analyzer configurations based on difficulty level with proper threshold scaling"""
         
-        # Define difficulty scaling factors
-        # Higher difficulty = stricter thresholds = lower scores for same performance
-        if self.difficulty == 'beginner':
-            # Most forgiving thresholds (easiest to get high scores)
-            threshold_multiplier = 1.1  # 10% more forgiving (was 1.2)
-            visibility_threshold = 0.6
-        elif self.difficulty == 'casual':
-            # Standard thresholds (baseline)
-            threshold_multiplier = 1.0  # No change from config
-            visibility_threshold = 0.7
-        elif self.difficulty == 'professional':
-            # Stricter thresholds (harder to get high scores)
-            threshold_multiplier = 0.9  # 10% stricter (was 0.85)
-            visibility_threshold = 0.8
-        elif self.difficulty == 'expert':
-            # Strictest thresholds (hardest to get high scores)
-            threshold_multiplier = 0.8  # 20% stricter (was 0.7)
-            visibility_threshold = 0.85
+        threshold_multiplier, visibility_threshold = self.DIFFICULTY_SCALING[self.difficulty]
         
         # Apply visibility thresholds
         for analyzer in self.analyzers.values():
@@ -0,0 +1,88 @@
+from PySide6.QtCore import QThread, QMutex, QMutexLocker, QWaitCondition, Signal
+
+
+class CaptureWorker(QThread):
+    """
+    Reads frames from a CameraManager on its own thread into a one-slot mailbox.
+
+    Live cameras overwrite the slot so the consumer always gets the newest frame.
+    Video files wait for the slot to be taken before reading the next frame so
+    no frame of a recording is skipped.
+
+    frame_skip frames are passed over (grabbed, not decoded) between the frames
+    that are delivered, to analyse high frame rate recordings at a lower rate.
+
+    Frames are decoded into pooled buffers. A consumer that is done with a frame
+    hands it back with recycle(); frames that are never returned are simply
+    garbage collected and replaced by a fresh allocation.
+
+    frameReady is only emitted when the mailbox was empty: while a frame is
+    still waiting, its signal is already queued and the consumer will pick up
+    whichever frame is newest when it runs, so a busy GUI thread does not
+    build up a backlog of redundant signals.
+    """
+    MAX_POOLED_FRAMES = 4
+
+    frameReady = Signal()    # A new frame is waiting in the mailbox
+    sourceEnded = Signal()   # The camera failed or the video file ran out
+
+    def __init__(self, camera_manager, parent=None, frame_skip=0):
+        super().__init__(parent)
+        self.camera_manager = camera_manager
+        self.frame_skip = frame_skip
+        self._mutex = QMutex()
+        self._slot_taken = QWaitCondition()
+        self._latest = None
+        self._free_buffers = []
+        self._running = True
+        self.source_ended = False
+
+    def run(self):
+        wait_for_consumer = self.camera_manager.is_video_file
+
+        while self._running:
+            with QMutexLocker(self._mutex):
+                buffer = self._free_buffers.pop() if self._free_buffers else None
+            frame = self.camera_manager.grab_and_retrieve(self.frame_skip, out=buffer)
+            if frame is None:
+                self.source_ended = True
+                self.sourceEnded.emit()
+                break
+
+            with QMutexLocker(self._mutex):
+                if wait_for_consumer:
+                    while self._latest is not None and self._running:
+                        self._slot_taken.wait(self._mutex)
+                notify = self._latest is None
+                if not notify:
+                    self._return_buffer(self._latest)  # Overwritten before anyone took it
+                self._latest = frame
+            if notify:
+                self.frameReady.emit()
+
+    def take_latest(self):
+        """Returns the newest frame and empties the mailbox, or None if nothing new arrived."""
+        with QMutexLocker(self._mutex):
+            frame = self._latest
+            self._latest = None
+            self._slot_taken.wakeAll()
+        return frame
+
+    def recycle(self, frame):
+        """Hands a frame back for reuse once the consumer no longer needs it."""
+        if frame is None:
+            return
+        with QMutexLocker(self._mutex):
+            self._return_buffer(frame)
+
+    def _return_buffer(self, frame):
+        # Caller holds self._mutex
+        if len(self._free_buffers) < self.MAX_POOLED_FRAMES:
+            self._free_buffers.append(frame)
+
+    def stop(self):
+        """Stops the capture loop and waits for the thread to exit."""
+        with QMutexLocker(self._mutex):
+            self._running = False
+            self._slot_taken.wakeAll()
+        self.wait()
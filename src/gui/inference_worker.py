@@ -0,0 +1,138 @@
+import logging
+import time
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QThread, QMutex, QMutexLocker, QWaitCondition, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceWorker(QThread):
+    """
+    Runs PoseProcessor.process_frame on its own thread.
+
+    Frames are submitted into a one-slot mailbox; a frame submitted while the
+    previous one is still waiting replaces it, so inference never works through
+    a backlog of stale frames. Results are delivered via resultReady; by the
+    time it (or errorOccurred) is emitted the worker no longer counts the
+    frame as busy, so is_idle() from the slot reflects only newer submissions.
+
+    Changes to the pose processor's state (resets, grader difficulty, ...) go
+    through call_between_frames so they never land in the middle of a frame.
+
+    Frames whose longest side exceeds max_side are downscaled for inference
+    into a scratch buffer owned by this thread and reused across frames.
+    """
+    resultReady = Signal(object, float)  # ProcessResult, processing time in seconds
+    errorOccurred = Signal(str)          # A frame failed; the worker carries on with the next
+
+    def __init__(self, pose_processor, parent=None, max_side=None):
+        super().__init__(parent)
+        self.pose_processor = pose_processor
+        self.max_side = max_side
+        self._scratch = None
+        self._mutex = QMutex()
+        self._has_input = QWaitCondition()
+        self._pending = None
+        self._calls = []
+        self._busy = False
+        self._running = True
+
+    def submit(self, frame, display_frame=None, force_detect=False):
+        """
+        Queues a frame for inference, replacing any frame not yet started.
+
+        Returns the display_frame of the replaced submission (or None) so the
+        caller can reuse its buffer.
+        """
+        with QMutexLocker(self._mutex):
+            replaced = self._pending
+            self._pending = (frame, display_frame, force_detect)
+            self._has_input.wakeOne()
+        return replaced[1] if replaced is not None else None
+
+    def call_between_frames(self, fn):
+        """
+        Runs fn on the inference thread before it starts the next frame, or
+        straight away on the calling thread if the worker is not running.
+        """
+        with QMutexLocker(self._mutex):
+            if self.isRunning() and self._running:
+                self._calls.append(fn)
+                self._has_input.wakeOne()
+                return
+        fn()
+
+    def _downscale(self, frame):
+        """Returns frame shrunk to max_side, written into the reused scratch buffer."""
+        height, width = frame.shape[:2]
+        longest_side = max(height, width)
+        if not self.max_side or longest_side <= self.max_side:
+            return frame
+        scale = self.max_side / longest_side
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        shape = (size[1], size[0]) + frame.shape[2:]
+        if self._scratch is None or self._scratch.shape != shape or self._scratch.dtype != frame.dtype:
+            self._scratch = np.empty(shape, dtype=frame.dtype)
+        interpolation = cv2.INTER_AREA if scale <= 0.5 else cv2.INTER_LINEAR
+        cv2.resize(frame, size, dst=self._scratch, interpolation=interpolation)
+        return self._scratch
+
+    def has_pending(self):
+        """True while a submitted frame is waiting for the worker to pick it up."""
+        with QMutexLocker(self._mutex):
+            return self._pending is not None
+
+    def is_idle(self):
+        """True when no frame is queued or being processed."""
+        with QMutexLocker(self._mutex):
+            return self._pending is None and not self._busy
+
+    def run(self):
+        while True:
+            with QMutexLocker(self._mutex):
+                while self._pending is None and not self._calls and self._running:
+                    self._has_input.wait(self._mutex)
+                calls, self._calls = self._calls, []
+                if not calls:
+                    if not self._running:
+                        break
+                    frame, display_frame, force_detect = self._pending
+                    self._pending = None
+                    self._busy = True
+                    pose_processor = self.pose_processor
+
+            if calls:
+                for fn in calls:
+                    try:
+                        fn()
+                    except Exception as e:
+                        logger.error("Error applying pose processor change: %s", e)
+                continue
+
+            result = error = None
+            start = time.perf_counter()
+            try:
+                result = pose_processor.process_frame(
+                    self._downscale(frame), force_detect=force_detect, display_frame=display_frame
+                )
+            except Exception as e:
+                error = f"Pose inference error: {e}"
+            elapsed = time.perf_counter() - start
+
+            # Idle before emitting: a queued slot may run before this thread
+            # gets the mutex again, and must not see this frame as in flight
+            with QMutexLocker(self._mutex):
+                self._busy = False
+            if error is None:
+                self.resultReady.emit(result, elapsed)
+            else:
+                self.errorOccurred.emit(error)
+
+    def stop(self):
+        """Stops the inference loop and waits for the current frame to finish."""
+        with QMutexLocker(self._mutex):
+            self._running = False
+            self._has_input.wakeAll()
+        self.wait()
@@ -1,10 +1,11 @@
 import sys
 import cv2
 import time
+import math
+import logging
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
-import time
-import cv2
-import random
 from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout,
                              QHBoxLayout, QWidget, QLabel, QFileDialog,
                              QTextEdit, QSplitter, QGridLayout,
@@ -13,14 +14,14 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayo
                              QSizePolicy, QStackedWidget)
 from PySide6.QtGui import (QImage, QPixmap, QAction, QFont, QPainter, QPen, 
                           QBrush, QColor, QConicalGradient, QLinearGradient)
-from PySide6.QtCore import Qt, QTimer, QRect, QPointF
+from PySide6.QtCore import Qt, QTimer, QRect, QPointF, QEvent
 from src.capture.camera import CameraManager
+from src.gui.capture_worker import CaptureWorker
+from src.gui.inference_worker import InferenceWorker
 from src.processing.pose_processor import PoseProcessor
 from src.grading.advanced_form_grader import UserProfile, UserLevel, IntelligentFormGrader, ThresholdConfig
 from src.pose.pose_detector import PoseDetector
 from src.utils.rep_counter import RepCounter
-from src.gui.widgets.settings_dialog import SettingsDialog
-from src.gui.widgets.session_report import SessionReportDialog
 from src.config.config_manager import ConfigManager
 from src.gui.widgets.session_report import SessionManager
 
@@ -30,6 +31,55 @@ from src.gui.widgets.user_profile_dialog import UserProfileDialog
 from src.gui.widgets.main_menu_screen import MainMenuScreen
 from src.gui.widgets.squat_guide_screen import SquatGuideScreen
 
+logger = logging.getLogger(__name__)
+
+APP_STYLESHEET_PATH = Path(__file__).parent / "styles" / "app.qss"
+
+# Qt enum members resolve through Shiboken on every access; the display path
+# runs per frame, so it uses these bound once at import
+DISPLAY_IMAGE_FORMAT = QImage.Format_BGR888
+NO_FORMAT_CONVERSION = Qt.NoFormatConversion
+
+
+@lru_cache(maxsize=1)
+def load_app_stylesheet():
+    """Returns the application stylesheet, read from disk once per process."""
+    return APP_STYLESHEET_PATH.read_text(encoding="utf-8")
+
+# Static pieces of the per-rep analysis HTML, built once instead of per rep
+REP_ANALYSIS_HEADER_HTML = """
+            <div style='font-family: Arial; color: #e0e0e0; line-height: 1.4; font-size: 15px;'>
+                <h2 style='color: #4CAF50; text-align: center; margin: 0 0 12px 0; font-size: 20px; font-weight: bold;'>
+                    Rep Analysis: {score:.1f}%
+                </h2>
+"""
+FAULTS_SECTION_HTML = """
+                <div style='background: rgba(244, 67, 54, 0.18); padding: 12px; border-radius: 8px; margin-bottom: 12px; border: 2px solid #FF5252;'>
+                    <h3 style='color: #FF1744; margin: 0 0 10px 0; font-size: 18px; font-weight: bold; letter-spacing: 1px;'>
+                        ⚠️ Key Issues
+                    </h3>
+                    <ul style='margin: 0; padding-left: 22px; font-size: 15px; font-weight: bold;'>
+"""
+FAULT_ITEM_HTML = "<li style='color: #FF8A80; margin-bottom: 6px;'>{}</li>"
+TIPS_SECTION_HTML = """
+                <div style='background: rgba(33, 150, 243, 0.10); padding: 10px; border-radius: 8px; margin-bottom: 10px;'>
+                    <h3 style='color: #2196F3; margin: 0 0 8px 0; font-size: 16px; font-weight: bold;'>💡 Tips</h3>
+                    <ul style='margin: 0; padding-left: 20px; font-size: 14px;'>
+"""
+TIP_ITEM_HTML = "<li style='color: #B2DFDB; margin-bottom: 4px;'>{}</li>"
+FOCUS_SECTION_HTML = """
+                <div style='background: rgba(156, 39, 176, 0.10); padding: 10px; border-radius: 8px;'>
+                    <h3 style='color: #9C27B0; margin: 0 0 8px 0; font-size: 16px; font-weight: bold;'>🎯 Focus</h3>
+                    <ul style='margin: 0; padding-left: 20px; font-size: 14px;'>
+"""
+FOCUS_ITEM_HTML = "<li style='color: #CE93D8; margin-bottom: 4px;'>{}</li>"
+SECTION_END_HTML = "</ul></div>"
+EXCELLENT_FORM_HTML = """
+                <div style='background: rgba(76, 175, 80, 0.12); padding: 18px; border-radius: 8px; text-align: center;'>
+                    <p style='color: #4CAF50; margin: 0; font-size: 18px; font-weight: bold;'>✨ Excellent form!</p>
+                </div>
+"""
+
 
 class ModernProgressBar(QWidget):
     """Clean, modern progress bar with labels and colors"""
@@ -49,13 +99,20 @@ class ModernProgressBar(QWidget):
         
     def setValue(self, value):
         """Set value with smooth animation"""
+        # A string has no numeric value; show the bar empty
         if isinstance(value, str):
-            self._value = 0
-            self._target_value = 0
-            self.update()
+            if self._value or self._target_value:
+                self.animation_timer.stop()
+                self._value = 0
+                self._target_value = 0
+                self.update()
             return
         
-        self._target_value = max(0, min(value, 100))
+        target = max(0, min(value, 100))
+        if target == self._target_value and target == self._value:
+            return  # Already showing this value; no animation or repaint needed
+        
+        self._target_value = target
         if not self.animation_timer.isActive():
             self.animation_timer.start(50)
     
@@ -103,7 +160,7 @@ class ModernProgressBar(QWidget):
             painter.drawText(QRect(0, 0, self.width(), 15), Qt.AlignRight, value_text)
             
         except Exception as e:
-            print(f"Error painting progress bar: {e}")
+            logger.error("Error painting progress bar: %s", e)
         finally:
             painter.end()
 
@@ -130,7 +187,8 @@ class CompactMetricWidget(QWidget):
         title_label.setFixedWidth(35)
         
         # Value
-        self.value_label = QLabel("--")
+        self._text = "--"
+        self.value_label = QLabel(self._text)
         self.value_label.setStyleSheet(f"""
             QLabel {{
                 color: #FFFFFF;
@@ -152,8 +210,11 @@ class CompactMetricWidget(QWidget):
         self.setFixedHeight(30)
         
     def setValue(self, value):
-        """Update the displayed value"""
-        self.value_label.setText(str(value))
+        """Update the displayed value, skipping the relayout when it is unchanged"""
+        text = str(value)
+        if text != self._text:
+            self._text = text
+            self.value_label.setText(text)
 
 
 class ModernCardWidget(QFrame):
@@ -219,13 +280,18 @@ class EnhancedCircularGauge(QWidget):
         
     def setValue(self, value):
         """Set value with smooth animation and update color"""
-        # If value is a string (e.g., phase), just display it
+        # A string (e.g., phase) has no numeric value; show the gauge empty
         if isinstance(value, str):
-            self._value = 0
-            self._target_value = 0
-            self.update()
+            if self._value or self._target_value:
+                self.animation_timer.stop()
+                self._value = 0
+                self._target_value = 0
+                self.update()
             return
-        self._target_value = max(0, min(value, self._max_value))
+        target = max(0, min(value, self._max_value))
+        if target == self._target_value and target == self._value:
+            return  # Already showing this value; no animation or repaint needed
+        self._target_value = target
         # Traffic light color system
         if self._target_value >= 85:
             self._color = "#4CAF50"  # Green
@@ -298,7 +364,7 @@ class EnhancedCircularGauge(QWidget):
                 painter.drawText(title_rect, Qt.AlignCenter, self._title)
                 
         except Exception as e:
-            print(f"Error painting gauge: {e}")
+            logger.error("Error painting gauge: %s", e)
         finally:
             painter.end()
 
@@ -328,7 +394,8 @@ class MetricDisplayWidget(QWidget):
         layout.addLayout(header_layout)
         
         # Value display - COMPACT
-        self.value_label = QLabel("--")
+        self._text = "--"
+        self.value_label = QLabel(self._text)
         self.value_label.setStyleSheet(f"""
             QLabel {{
                 color: #FFFFFF;
@@ -350,8 +417,11 @@ class MetricDisplayWidget(QWidget):
         self.setMaximumSize(100, 80)
     
     def setValue(self, value):
-        """Update the displayed value"""
-        self.value_label.setText(str(value))
+        """Update the displayed value, skipping the relayout when it is unchanged"""
+        text = str(value)
+        if text != self._text:
+            self._text = text
+            self.value_label.setText(text)
 
 class SparklineWidget(QWidget):
     """Ultra-minimalist sparkline showing only the performance trend"""
@@ -430,6 +500,76 @@ class SparklineWidget(QWidget):
 
 class MainWindow(QMainWindow):
     """Modern AI Fitness Coach Main Window with Welcome Screen System"""
+    
+    FRAME_INTERVAL_MS = 30  # Nominal camera frame period, for judging inference load
+    WEBCAM_FPS = 30  # Frame rate requested from (and analysed for) live cameras
+    INFERENCE_MAX_SIDE = 640  # Default for inference_max_side; MediaPipe resizes to 256x256 internally anyway
+    STATUS_UPDATE_INTERVAL_NS = 500_000_000
+    ERROR_REPEAT_INTERVAL_NS = 2_000_000_000
+    REP_ANALYSIS_DISPLAY_S = 10.0
+    METRICS_UPDATE_INTERVAL_NS = 200_000_000
+    STATUS_TEMPLATE = "📊 FPS: %.1f | 🎯 Reps: %d | 🤖 Pose: %s"
+    STATUS_SKIP_TEMPLATE = " | ⏩ Pose every %d frames (%.1f× realtime)"
+    POSE_OK_ICON = "✅"
+    POSE_MISSING_ICON = "❌"
+    
+    # Voice status label styles, keyed by state bucket
+    VOICE_STATUS_STYLES = {
+        'active': """
+            QLabel {
+                color: #4CAF50; font-weight: bold; font-size: 12px;
+                padding: 4px 8px; background-color: rgba(76, 175, 80, 0.1);
+                border-radius: 4px; border: 1px solid rgba(76, 175, 80, 0.3);
+            }
+        """,
+        'error': """
+            QLabel {
+                color: #FF9800; font-weight: bold; font-size: 12px;
+                padding: 4px 8px; background-color: rgba(255, 152, 0, 0.1);
+                border-radius: 4px; border: 1px solid rgba(255, 152, 0, 0.3);
+            }
+        """,
+        'off': """
+            QLabel {
+                color: #757575; font-weight: bold; font-size: 12px;
+                padding: 4px 8px; background-color: rgba(117, 117, 117, 0.1);
+                border-radius: 4px; border: 1px solid rgba(117, 117, 117, 0.3);
+            }
+        """,
+    }
+    
+    # Rep counter label style, and the brief highlight shown when a rep lands
+    # Set once; the rep flash toggles the 'flash' property instead of reparsing a sheet
+    REP_LABEL_STYLE = """
+        QLabel {
+            color: white; font-size: 32px; font-weight: 900;
+            background: transparent; border: none; border-radius: 8px;
+            padding: 2px; min-height: 35px; text-align: center;
+            font-family: 'Arial Black', Arial, sans-serif;
+        }
+        QLabel[flash="true"] {
+            color: #FFD700;
+            background: rgba(255, 215, 0, 0.15); border: 2px solid #FFD700;
+        }
+    """
+    
+    # User-facing names for the rep counter's movement phases
+    PHASE_LABELS = {
+        'bottom': 'Bottom',
+        'descent': 'Down',
+        'ascent': 'Up',
+        'standing': 'Ready',
+        'ready': 'Ready',
+    }
+    
+    # Difficulty combo entries: (label, grader difficulty, user skill level)
+    DIFFICULTY_LEVELS = (
+        ("Beginner", "beginner", UserLevel.BEGINNER),
+        ("Casual", "casual", UserLevel.INTERMEDIATE),
+        ("Professional", "professional", UserLevel.ADVANCED),
+        ("Expert", "expert", UserLevel.EXPERT),
+    )
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AI Fitness Coach - Advanced Form Analysis")
@@ -440,6 +580,8 @@ class MainWindow(QMainWindow):
         # Core components
         self.config_manager = ConfigManager()
         self.camera_manager = None
+        self.capture_worker = None
+        self.inference_worker = None
         self.session_manager = SessionManager()
         
         # Session tracking
@@ -467,14 +609,26 @@ class MainWindow(QMainWindow):
         )
         
         # Timers
-        self.timer = QTimer(self)
-        self.rep_analysis_display_timer = QTimer(self)
-        self.rep_analysis_display_timer.setSingleShot(True)
+        self._frames_active = False  # Captured frames are being analysed (not counting down or stopped)
+        self._rep_display_until = 0.0  # perf_counter deadline for clearing the rep analysis, 0 = none
         self._last_report_ts = 0
-        
-        # Session duration timer
-        self.session_timer = QTimer(self)
-        self.session_timer.timeout.connect(self.update_session_duration)
+        self._last_status_ns = 0
+        self._last_status_state = None
+        self._last_status_key = None  # Rounded values the status bar text was built from
+        self._last_status_msg = ''
+        self._last_metrics_ns = 0
+        self._last_error = ('', 0)  # (message, monotonic ns) of the last runtime error shown
+        self._last_metrics_phase = None
+        self._display_fps = 0.0  # EMA of frames shown per second, skipped inference frames included
+        self._last_frame_ns = 0
+        self._display_buffer = None  # Reused BGR buffer the video frame is resized into
+        self._display_image = None  # QImage over _display_buffer, rebuilt only with the buffer
+        self._display_geometry = None  # (frame_w, frame_h, dst_w, dst_h, interpolation), cleared when video_label resizes
+        self._processing_budget = 0.0  # EMA of per-frame processing time (seconds)
+        self._frame_ix = 0
+        self._skip_n = 1  # Run pose inference on every Nth frame
+        self._is_live_source = False
+        self._closing = False  # Set by closeEvent; suppresses the post-session report
         
         # Countdown timer for 3-second start delay
         self.countdown_timer = QTimer(self)
@@ -489,38 +643,9 @@ class MainWindow(QMainWindow):
     
     def setup_ui(self):
         """Setup the modern UI with screen management system"""
-        # Modern dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e1e1e, stop:1 #2d2d2d);
-            }
-            QLabel { color: #e0e0e0; }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4CAF50, stop:1 #388E3C);
-                color: white; border: none;
-                padding: 12px 20px; border-radius: 8px;
-                font-weight: bold; font-size: 14px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66BB6A, stop:1 #4CAF50);
-            }
-            QPushButton:disabled {
-                background-color: #555; color: #aaa;
-            }
-            QTextEdit {
-                background-color: #2a2a2a; color: #e0e0e0;
-                border: 1px solid #555; border-radius: 8px;
-                padding: 10px; font-size: 13px;
-            }
-            QComboBox {
-                background-color: #3c3c3c; color: #e0e0e0;
-                border: 1px solid #555; border-radius: 6px;
-                padding: 8px; font-size: 14px;
-            }
-        """)
+        # Modern dark theme; run_app applies it application-wide before any widget exists
+        if not QApplication.instance().styleSheet():
+            self.setStyleSheet(load_app_stylesheet())
         
         # Create the stacked widget for screen management
         self.stacked_widget = QStackedWidget()
@@ -629,6 +754,7 @@ class MainWindow(QMainWindow):
         self.video_label.setMinimumSize(400, 300)  # Reduced from 800x600
         self.video_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.video_label.setScaledContents(False)  # Keep this False for proper aspect ratio
+        self.video_label.installEventFilter(self)
         
         self.video_label.setStyleSheet("""
             QLabel {
@@ -650,21 +776,10 @@ class MainWindow(QMainWindow):
         self.video_button = QPushButton("📁 Load Video")
         self.stop_button = QPushButton("⏹️ Stop Session")
         self.stop_button.setEnabled(False)
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #F44336, stop:1 #D32F2F);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #EF5350, stop:1 #F44336);
-            }
-        """)
+        self.stop_button.setObjectName("danger")
         
         # UPDATED: 4-level difficulty system
-        self.difficulty_combo = QComboBox()
-        self.difficulty_combo.addItems(["Beginner", "Casual", "Professional", "Expert"])
-        self.difficulty_combo.setCurrentText("Casual")
+        self.difficulty_combo = self._create_difficulty_combo()
         
         controls_layout.addWidget(self.webcam_button)
         controls_layout.addWidget(self.video_button)
@@ -674,20 +789,7 @@ class MainWindow(QMainWindow):
         self.voice_feedback_button = QPushButton("🔊 Voice: ON")
         self.voice_feedback_button.setCheckable(True)
         self.voice_feedback_button.setChecked(True)
-        self.voice_feedback_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2196F3, stop:1 #1976D2);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #42A5F5, stop:1 #2196F3);
-            }
-            QPushButton:checked {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4CAF50, stop:1 #388E3C);
-            }
-        """)
+        self.voice_feedback_button.setObjectName("primary")
         controls_layout.addWidget(self.voice_feedback_button)
         
         controls_layout.addStretch()
@@ -701,6 +803,14 @@ class MainWindow(QMainWindow):
         
         return panel
     
+    def _create_difficulty_combo(self):
+        """Difficulty selector whose items carry their (grader difficulty, skill level) pair"""
+        combo = QComboBox()
+        for label, difficulty, skill_level in self.DIFFICULTY_LEVELS:
+            combo.addItem(label, (difficulty, skill_level))
+        combo.setCurrentText("Casual")
+        return combo
+    
     def _create_video_panel_with_dashboard(self):
         """Create the video panel with compact session dashboard on the left"""
         panel = QWidget()
@@ -720,6 +830,7 @@ class MainWindow(QMainWindow):
         self.video_label.setAlignment(Qt.AlignCenter)
         self.video_label.setMinimumSize(400, 300)
         self.video_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.video_label.installEventFilter(self)
         self.video_label.setScaledContents(False)
         
         self.video_label.setStyleSheet("""
@@ -742,20 +853,9 @@ class MainWindow(QMainWindow):
         self.video_button = QPushButton("📁 Load Video")
         self.stop_button = QPushButton("⏹️ Stop Session")
         self.stop_button.setEnabled(False)
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #F44336, stop:1 #D32F2F);
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #EF5350, stop:1 #F44336);
-            }
-        """)
+        self.stop_button.setObjectName("danger")
         
-        self.difficulty_combo = QComboBox()
-        self.difficulty_combo.addItems(["Beginner", "Casual", "Professional", "Expert"])
-        self.difficulty_combo.setCurrentText("Casual")
+        self.difficulty_combo = self._create_difficulty_combo()
         
         controls_layout.addWidget(self.webcam_button)
         controls_layout.addWidget(self.video_button)
@@ -815,14 +915,9 @@ class MainWindow(QMainWindow):
         
         # Score label with dynamic color
         self.avg_score_label = QLabel("Score: --%")
-        self.avg_score_label.setStyleSheet("""
-            QLabel {
-                color: #4CAF50;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 4px;
-            }
-        """)
+        self.avg_score_label.setObjectName("avgScore")
+        self._avg_score_bucket = None
+        self._set_avg_score_bucket("good")
 
         stats_layout.addWidget(self.rep_count_label)
         stats_layout.addWidget(self.avg_score_label)
@@ -832,21 +927,7 @@ class MainWindow(QMainWindow):
         reset_button = QPushButton("🔄")
         reset_button.setFixedSize(35, 35)
         reset_button.setToolTip("Reset Session")
-        reset_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #607D8B, stop:1 #455A64);
-                color: white;
-                border: none;
-                border-radius: 17px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #78909C, stop:1 #607D8B);
-            }
-        """)
+        reset_button.setObjectName("sessionReset")
         reset_button.clicked.connect(self._reset_session)
         stats_layout.addWidget(reset_button)
 
@@ -858,31 +939,35 @@ class MainWindow(QMainWindow):
         self.session_start_time = None
         self.session_reps = 0
         self.session_scores = []
+        self._session_score_total = 0.0  # Running sum of session_scores for the average
 
         return dashboard_card
     
+    def _set_avg_score_bucket(self, bucket):
+        """Recolor the average score label via its 'bucket' property, repolishing only on change"""
+        if bucket == self._avg_score_bucket:
+            return
+        self._avg_score_bucket = bucket
+        self.avg_score_label.setProperty("bucket", bucket)
+        style = self.avg_score_label.style()
+        style.unpolish(self.avg_score_label)
+        style.polish(self.avg_score_label)
+    
     def _reset_session(self):
         """Reset the session statistics"""
         self.session_start_time = None
         self.session_reps = 0
         self.session_scores = []
+        self._session_score_total = 0.0  # Running sum of session_scores for the average
         
         # Reset sparkline widget and labels
-        if hasattr(self, 'sparkline_widget'):
-            self.sparkline_widget.reset()
-            self.rep_count_label.setText("Rep: --")
-            self.avg_score_label.setText("Score: --%")
-            # Reset label color to default
-            self.avg_score_label.setStyleSheet("""
-                QLabel {
-                    color: #4CAF50;
-                    font-size: 16px;
-                    font-weight: bold;
-                    padding: 4px;
-                }
-            """)
+        self.sparkline_widget.reset()
+        self.rep_count_label.setText("Rep: --")
+        self.avg_score_label.setText("Score: --%")
+        # Reset label color to default
+        self._set_avg_score_bucket("good")
         
-        print("🔄 Session stats reset")
+        logger.info("Session stats reset")
     
     def _create_modern_analytics_panel(self):
         """Create OPTIMIZED analytics panel with feedback prioritized"""
@@ -900,13 +985,8 @@ class MainWindow(QMainWindow):
         # Enhanced feedback status bar
         feedback_status_layout = QHBoxLayout()
         self.voice_status_label = QLabel("🔊 Voice: Ready")
-        self.voice_status_label.setStyleSheet("""
-            QLabel {
-                color: #4CAF50; font-weight: bold; font-size: 12px;
-                padding: 4px 8px; background-color: rgba(76, 175, 80, 0.1);
-                border-radius: 4px; border: 1px solid rgba(76, 175, 80, 0.3);
-            }
-        """)
+        self._voice_status_bucket = None
+        self._set_voice_status("🔊 Voice: Ready", 'active')
         
         self.feedback_stats_label = QLabel("Messages: 0 | Voice: 0")
         self.feedback_stats_label.setStyleSheet("""
@@ -986,20 +1066,8 @@ class MainWindow(QMainWindow):
         rep_title.setAlignment(Qt.AlignCenter)
         
         self.rep_label = QLabel("0")
-        self.rep_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: 900;
-                background: transparent;
-                border: none;
-                border-radius: 8px;
-                padding: 2px;
-                min-height: 35px;
-                text-align: center;
-                font-family: 'Arial Black', Arial, sans-serif;
-            }
-        """)
+        self.rep_label.setStyleSheet(self.REP_LABEL_STYLE)
+        self._rep_flash = False
         self.rep_label.setAlignment(Qt.AlignCenter)
         
         rep_layout.addWidget(rep_title)
@@ -1009,21 +1077,7 @@ class MainWindow(QMainWindow):
         # Reset button
         reset_button = QPushButton("🔄 Reset")
         reset_button.setFixedSize(80, 30)
-        reset_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FF6B6B, stop:1 #E63946);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #E63946, stop:1 #D62828);
-            }
-        """)
+        reset_button.setObjectName("analyticsReset")
         reset_button.clicked.connect(self._reset_analytics_panel)
         
         top_row.addWidget(rep_container)
@@ -1118,6 +1172,12 @@ class MainWindow(QMainWindow):
         self.validation_action.setChecked(False)
         self.validation_action.triggered.connect(self.toggle_validation_mode)
         debug_menu.addAction(self.validation_action)
+        
+        settings_menu = menubar.addMenu('⚙️ Settings')
+        self.full_model_action = QAction('🧠 Use Full Pose Model (slower)', self, checkable=True)
+        self.full_model_action.setChecked(self.current_settings.get('mediapipe_model_complexity', 0) > 0)
+        self.full_model_action.triggered.connect(self.toggle_pose_model)
+        settings_menu.addAction(self.full_model_action)
     
     def setup_connections(self):
         """Setup signal connections for all screens"""
@@ -1125,9 +1185,7 @@ class MainWindow(QMainWindow):
         self.webcam_button.clicked.connect(self.start_webcam)
         self.video_button.clicked.connect(self.open_video_file)
         self.stop_button.clicked.connect(self.stop_session)
-        self.timer.timeout.connect(self.update_frame)
-        self.difficulty_combo.currentTextChanged.connect(self.on_difficulty_changed)
-        self.rep_analysis_display_timer.timeout.connect(self.clear_rep_analysis_display)
+        self.difficulty_combo.currentIndexChanged.connect(self.on_difficulty_changed)
         
         # Voice feedback connection
         self.voice_feedback_button.clicked.connect(self.toggle_voice_feedback)
@@ -1190,30 +1248,52 @@ class MainWindow(QMainWindow):
     def _start_session(self, source):
         """Start session (keeping existing logic)"""
         try:
-            if self.camera_manager:
-                self.camera_manager.release()
+            self._stop_workers()
             
             self.camera_manager = CameraManager(source)
             if not self.camera_manager.isOpened():
                 raise RuntimeError(f"Failed to open source: {source}")
             
             if isinstance(source, int):
-                self.camera_manager.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-                self.camera_manager.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+                buffer_size = int(self.current_settings.get('camera_buffer_size', 1))
+                self.camera_manager.configure_webcam(1280, 720, fps=self.WEBCAM_FPS,
+                                                buffer_size=buffer_size)
+            
+            # Capture runs on its own thread and signals update_frame for each new frame
+            self.capture_worker = CaptureWorker(self.camera_manager, self,
+                                                frame_skip=self._source_frame_skip())
+            self.capture_worker.frameReady.connect(self.update_frame)
+            self.capture_worker.sourceEnded.connect(self.update_frame)
+            self.capture_worker.start()
             
             source_type = 'video' if isinstance(source, str) else 'webcam'
+            self.pose_processor.update_settings(self.current_settings)
             self.pose_processor.start_session(source_type)
             
+            # Pose inference runs on its own thread and reports back via on_live_metrics
+            max_side = int(self.current_settings.get('inference_max_side', self.INFERENCE_MAX_SIDE))
+            self.inference_worker = InferenceWorker(self.pose_processor, self, max_side=max_side)
+            self.inference_worker.resultReady.connect(self.on_live_metrics)
+            self.inference_worker.errorOccurred.connect(self.on_inference_error)
+            self.inference_worker.start()
+            self._processing_budget = 0.0
+            self._force_detect_next = True  # New source: detect afresh, don't trust old tracking
+            self._frame_ix = 0
+            self._display_fps = 0.0
+            self._last_frame_ns = 0
+            self._skip_n = max(1, int(self.current_settings.get('skip_frames_base', 1)))
+            self._is_live_source = source_type == 'webcam'
+            
             # Start session timing
             self.session_start_time = time.time()
             self.session_feedback_messages = []  # Clear previous messages
-            self.session_timer.start(1000)  # Update every second
             
             self.webcam_button.setEnabled(False)
             self.video_button.setEnabled(False)
             self.stop_button.setEnabled(True)
             
             # Start countdown before beginning analysis
+            self._frames_active = False
             self.countdown_active = True
             self.countdown_seconds = 3
             self.countdown_timer.start(1000)  # Update every second
@@ -1231,19 +1311,14 @@ class MainWindow(QMainWindow):
         if self.session_start_time:
             self.session_duration = time.time() - self.session_start_time
         
-        self.timer.stop()
+        self._frames_active = False
         
         # Stop countdown timer if active
         if self.countdown_timer.isActive():
             self.countdown_timer.stop()
             self.countdown_active = False
         
-        # Stop session timing
-        self.session_timer.stop()
-        
-        if self.camera_manager:
-            self.camera_manager.release()
-            self.camera_manager = None
+        self._stop_workers()
         
         self.pose_processor.end_session()
         
@@ -1255,31 +1330,44 @@ class MainWindow(QMainWindow):
         # Keep compact dashboard stats for review - user can manually reset
         
         # Show report after delay
-        from PySide6.QtCore import QTimer
-        def show_delayed_report():
-            total_reps = int(self.rep_label.text()) if self.rep_label.text().isdigit() else 0
-            if total_reps > 0:
-                self.show_enhanced_session_report()
-        
-        QTimer.singleShot(500, show_delayed_report)
+        QTimer.singleShot(500, self._show_delayed_report)
     
-    def update_session_duration(self):
-        """Update the session duration display"""
-        try:
-            if hasattr(self, 'session_start_time') and self.session_start_time:
-                current_time = time.time()
-                duration = current_time - self.session_start_time
-                
-                # Update the session duration metric
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_text = f"{minutes:02d}:{seconds:02d}"
-                
-                # Update the session duration widget if it exists
-                if hasattr(self, 'session_duration_widget'):
-                    self.session_duration_widget.value_label.setText(duration_text)
-        except Exception as e:
-            print(f"Error updating session duration: {e}")
+    def _show_delayed_report(self):
+        """Show the session report once the session has wound down, if any reps were done"""
+        if self._closing:
+            return
+        total_reps = int(self.rep_label.text()) if self.rep_label.text().isdigit() else 0
+        if total_reps > 0:
+            self.show_enhanced_session_report()
+    
+    def _source_frame_skip(self):
+        """
+        Frames to grab without decoding between delivered frames, so recordings
+        run near video_analysis_fps and live cameras near WEBCAM_FPS.
+        
+        Cameras that ignore the requested rate (e.g. fixed 60 FPS modes) would
+        otherwise have every frame decoded only for most to be overwritten.
+        """
+        source_fps = self.camera_manager.get_property(cv2.CAP_PROP_FPS)
+        if self.camera_manager.is_video_file:
+            target_fps = self.current_settings.get('video_analysis_fps', 30)
+        else:
+            target_fps = self.WEBCAM_FPS
+        if source_fps <= 0 or not target_fps:
+            return 0
+        return max(0, round(source_fps / target_fps) - 1)
+    
+    def _stop_workers(self):
+        """Stop the inference and capture threads, then release the camera"""
+        if self.inference_worker:
+            self.inference_worker.stop()
+            self.inference_worker = None
+        if self.capture_worker:
+            self.capture_worker.stop()
+            self.capture_worker = None
+        if self.camera_manager:
+            self.camera_manager.release()
+            self.camera_manager = None
     
     def update_countdown(self):
         """Update countdown timer and start session when complete"""
@@ -1287,20 +1375,21 @@ class MainWindow(QMainWindow):
             if self.countdown_seconds > 0:
                 self.countdown_seconds -= 1
                 # Force frame update to show countdown
-                if self.camera_manager and self.camera_manager.isOpened():
-                    frame = self.camera_manager.get_frame()
+                if self.capture_worker:
+                    frame = self.capture_worker.take_latest()
                     if frame is not None:
                         # Draw countdown overlay
-                        frame = self.draw_countdown_overlay(frame)
-                        self.display_frame_improved(frame)
+                        self.display_frame_improved(self.draw_countdown_overlay(frame))
+                        self.capture_worker.recycle(frame)
             else:
                 # Countdown finished, start actual analysis
                 self.countdown_timer.stop()
                 self.countdown_active = False
-                self.timer.start(30)  # Start main frame processing
+                self._frames_active = True  # Captured frames now drive analysis
+                self.update_frame()
                 self.status_bar.showMessage("🏋️ Session Started - Begin your workout!")
         except Exception as e:
-            print(f"Error updating countdown: {e}")
+            logger.error("Error updating countdown: %s", e)
     
     def draw_countdown_overlay(self, frame):
         """Draw countdown overlay on video frame"""
@@ -1308,10 +1397,15 @@ class MainWindow(QMainWindow):
             height, width = frame.shape[:2]
             center_x, center_y = width // 2, height // 2
             
-            # Draw semi-transparent background circle
-            overlay = frame.copy()
-            cv2.circle(overlay, (center_x, center_y), 100, (0, 0, 0), -1)
-            frame = cv2.addWeighted(frame, 0.6, overlay, 0.4, 0)
+            # Draw semi-transparent background circle, blending only the pixels
+            # around it in place rather than a copy of the whole frame
+            radius = 100
+            x0, y0 = max(center_x - radius, 0), max(center_y - radius, 0)
+            x1, y1 = min(center_x + radius + 1, width), min(center_y + radius + 1, height)
+            region = frame[y0:y1, x0:x1]
+            overlay = region.copy()
+            cv2.circle(overlay, (center_x - x0, center_y - y0), radius, (0, 0, 0), -1)
+            cv2.addWeighted(region, 0.6, overlay, 0.4, 0, dst=region)
             
             # Draw countdown number or "START!"
             font_scale = 4
@@ -1346,171 +1440,287 @@ class MainWindow(QMainWindow):
             cv2.putText(frame, instruction, (inst_x, inst_y), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
             
         except Exception as e:
-            print(f"Error drawing countdown overlay: {e}")
+            logger.error("Error drawing countdown overlay: %s", e)
         
         return frame
     
     def update_frame(self):
-        """Main update loop with enhanced display"""
-        frame = self.camera_manager.get_frame()
+        """
+        Frame pump: hands the newest captured frame to the inference worker.
+        
+        Driven by the capture worker's frameReady/sourceEnded signals, which are
+        queued onto the GUI thread, so a frame is picked up as soon as it exists
+        rather than on the next timer tick. frameReady is not repeated while a
+        frame is waiting, so any path that leaves the mailbox full must call
+        this again later (the countdown does, and _on_inference_done after
+        every inference result or error).
+        """
+        if not self._frames_active or self.capture_worker is None:
+            return  # Counting down, or a signal queued before the session stopped
+        
+        # Recordings never replace a queued frame, so none are dropped; the next
+        # frame is queued while the current one runs, so the worker never waits
+        # on a round trip through the GUI thread
+        if not self._is_live_source and self.inference_worker.has_pending():
+            return
+        
+        frame = self.capture_worker.take_latest()
         if frame is None:
-            self.stop_session()
+            # No new frame since the last tick, unless the source has run out;
+            # the session ends once the last submitted frame has its result
+            if self.capture_worker.source_ended and self.inference_worker.is_idle():
+                self.stop_session()
             return
         
-        live_metrics = self.pose_processor.process_frame(frame)
+        self._count_display_frame()
         
-        # Update rep count with visual feedback
-        rep_count = live_metrics.get('rep_count', 0)
-        self.rep_label.setText(str(rep_count))
-        
-        # Add visual flash effect when rep count increases
-        if hasattr(self, '_last_rep_count'):
-            if rep_count > self._last_rep_count:
-                # Flash effect for new rep
-                self.rep_label.setStyleSheet("""
-                    QLabel {
-                        color: #FFD700;
-                        font-size: 32px;
-                        font-weight: 900;
-                        background: rgba(255, 215, 0, 0.15);
-                        border: 2px solid #FFD700;
-                        border-radius: 8px;
-                        padding: 2px;
-                        min-height: 35px;
-                        text-align: center;
-                        font-family: 'Arial Black', Arial, sans-serif;
-                    }
-                """)
-                # Reset to normal after brief flash
-                QTimer.singleShot(500, lambda: self.rep_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 32px;
-                        font-weight: 900;
-                        background: transparent;
-                        border: none;
-                        border-radius: 8px;
-                        padding: 2px;
-                        min-height: 35px;
-                        text-align: center;
-                        font-family: 'Arial Black', Arial, sans-serif;
-                    }
-                """))
-        self._last_rep_count = rep_count
+        # Between inference frames just show the new frame with the last pose
+        self._frame_ix += 1
+        if self._frame_ix % self._skip_n:
+            if self._video_visible():
+                self.pose_processor.draw_last_pose(frame)
+                self.display_frame_improved(frame)
+            self.capture_worker.recycle(frame)
+            return
         
-        # Update phase
-        phase = live_metrics.get('phase', 'Ready')
-        phase_map = {
-            'bottom': 'Bottom',
-            'descent': 'Down', 
-            'ascent': 'Up',
-            'standing': 'Ready',
-            'ready': 'Ready',
-        }
-        friendly_phase = phase_map.get(phase.lower(), phase.capitalize() if phase else 'Ready')
-        self.phase_widget.setValue(friendly_phase)
+        # The worker downscales for inference into its own scratch buffer; the
+        # overlay is drawn on the full-resolution frame, which nothing else holds on to
+        replaced = self.inference_worker.submit(frame, display_frame=frame,
+                                                force_detect=self._force_detect_next)
+        self.capture_worker.recycle(replaced)
+        self._force_detect_next = False
+    
+    def on_live_metrics(self, live_metrics, processing_time):
+        """Update the UI from a pose inference result"""
+        if self.inference_worker is None:
+            return  # Result from a session that has since been stopped
         
-        # UPDATE: Real-time depth calculation per phase
-        current_depth_rating = self._calculate_live_depth_rating(live_metrics)
-        self.depth_widget.setValue(current_depth_rating)
+        # Update rep count with visual feedback
+        rep_count = live_metrics.rep_count
+        rep_text = str(rep_count)
+        if rep_text != self.rep_label.text():
+            self.rep_label.setText(rep_text)
+        
+        # Brief highlight when the rep count goes up
+        if rep_count > self._last_rep_count:
+            self._set_rep_flash(True)
+            QTimer.singleShot(500, lambda: self._set_rep_flash(False))
+        self._last_rep_count = rep_count
         
-        # Update tempo based on current movement
-        tempo_info = live_metrics.get('tempo', '--')
-        if isinstance(tempo_info, (int, float)) and tempo_info > 0:
-            self.tempo_widget.setValue(f"{tempo_info:.1f}s")
-        else:
-            self.tempo_widget.setValue("--")
+        # Metric widgets refresh a few times a second, or at once on a phase change
+        phase = live_metrics.phase
+        now_ns = time.monotonic_ns()
+        if (now_ns - self._last_metrics_ns >= self.METRICS_UPDATE_INTERVAL_NS
+                or phase != self._last_metrics_phase):
+            self._last_metrics_ns = now_ns
+            self._last_metrics_phase = phase
+            
+            # Update phase
+            friendly_phase = self.PHASE_LABELS.get(phase.lower(), phase.capitalize() if phase else 'Ready')
+            self.phase_widget.setValue(friendly_phase)
+            
+            # UPDATE: Real-time depth calculation per phase
+            current_depth_rating = self._calculate_live_depth_rating(live_metrics)
+            self.depth_widget.setValue(current_depth_rating)
+            
+            # Update tempo based on current movement
+            tempo_info = live_metrics.tempo
+            if isinstance(tempo_info, (int, float)) and tempo_info > 0:
+                self.tempo_widget.setValue(f"{tempo_info:.1f}s")
+            else:
+                self.tempo_widget.setValue("--")
         
         # Display frame
-        processed_frame = live_metrics.get('processed_frame')
+        processed_frame = live_metrics.processed_frame
         if processed_frame is not None:
             self.display_frame_improved(processed_frame)
+            # Displaying copies the pixels, so the capture buffer can be reused
+            if self.capture_worker:
+                self.capture_worker.recycle(processed_frame)
+        
+        # Clear the previous rep's analysis once it has been shown long enough
+        if self._rep_display_until and time.perf_counter() > self._rep_display_until:
+            self._rep_display_until = 0.0
+            self.clear_rep_analysis_display()
         
         # Handle rep analysis
-        report = live_metrics.get('last_rep_analysis')
-        if report and report.get('timestamp', 0) > self._last_report_ts:
-            self._last_report_ts = report['timestamp']
+        report = live_metrics.last_rep_analysis
+        report_ts = report.get('timestamp', 0) if report else 0
+        if report_ts > self._last_report_ts:
+            self._last_report_ts = report_ts
             self.display_comprehensive_analysis(report)
             
+            current_score = report.get('score', 0)
             self.session_manager.update_session(
                 rep_count=rep_count,
-                form_score=report.get('score', 0),
+                form_score=current_score,
                 phase=phase,
                 fault_data=report.get('faults', [])
             )
             
             # Update session dashboard with sparkline
-            if hasattr(self, 'sparkline_widget'):
-                # Initialize session start time on first rep
-                if self.session_start_time is None:
-                    self.session_start_time = time.time()
-                
-                # Update session tracking
-                self.session_reps = rep_count
-                current_score = report.get('score', 0)
-                self.session_scores.append(current_score)
-                
-                # Update the sparkline and labels
-                self.sparkline_widget.add_score(current_score)
-                self.rep_count_label.setText(f"Rep: {self.session_reps}")
+            # Initialize session start time on first rep
+            if self.session_start_time is None:
+                self.session_start_time = time.time()
+            
+            # Update session tracking
+            self.session_reps = rep_count
+            self.session_scores.append(current_score)
+            self._session_score_total += current_score
+            
+            # Update the sparkline and labels
+            self.sparkline_widget.add_score(current_score)
+            self.rep_count_label.setText(f"Rep: {self.session_reps}")
+            
+            # Calculate and display average score with color coding
+            if self.session_scores:
+                avg_score = self._session_score_total / len(self.session_scores)
+                self.avg_score_label.setText(f"Score: {avg_score:.1f}%")
                 
-                # Calculate and display average score with color coding
-                if self.session_scores:
-                    avg_score = sum(self.session_scores) / len(self.session_scores)
-                    self.avg_score_label.setText(f"Score: {avg_score:.1f}%")
-                    
-                    # Update label color based on performance
-                    if avg_score >= 85:
-                        color = "#4CAF50"  # Green
-                    elif avg_score >= 70:
-                        color = "#FFC107"  # Amber
-                    else:
-                        color = "#FF5722"  # Red
-                    
-                    self.avg_score_label.setStyleSheet(f"""
-                        QLabel {{
-                            color: {color};
-                            font-size: 16px;
-                            font-weight: bold;
-                            padding: 4px;
-                        }}
-                    """)
-        
-        # Status bar
-        status_msg = (f"📊 FPS: {live_metrics.get('fps', 0):.1f} | "
-                     f"🎯 Reps: {rep_count} | "
-                     f"🤖 Pose: {'✅' if live_metrics.get('landmarks_detected') else '❌'}")
-        self.status_bar.showMessage(status_msg)
+                # Update label color based on performance
+                if avg_score >= 85:
+                    self._set_avg_score_bucket("good")   # Green
+                elif avg_score >= 70:
+                    self._set_avg_score_bucket("fair")   # Amber
+                else:
+                    self._set_avg_score_bucket("poor")   # Red
+        
+        # Status bar - refreshed at most twice a second (faster is unreadable
+        # anyway) or straight away when the session state changes
+        session_state = live_metrics.session_state
+        if (now_ns - self._last_status_ns >= self.STATUS_UPDATE_INTERVAL_NS
+                or session_state != self._last_status_state):
+            self._last_status_ns = now_ns
+            self._last_status_state = session_state
+            # Compare at display precision; format and repaint only on a visible change,
+            # or when another message has replaced ours in the meantime
+            load = round(self._processing_budget * 1000 / self.FRAME_INTERVAL_MS, 1) if self._skip_n > 1 else 0
+            status_key = (round(self._display_fps, 1), rep_count,
+                          live_metrics.landmarks_detected, self._skip_n, load)
+            if (status_key != self._last_status_key
+                    or self.status_bar.currentMessage() != self._last_status_msg):
+                self._last_status_key = status_key
+                pose_icon = self.POSE_OK_ICON if live_metrics.landmarks_detected else self.POSE_MISSING_ICON
+                status_msg = self.STATUS_TEMPLATE % (self._display_fps, rep_count, pose_icon)
+                if self._skip_n > 1:
+                    status_msg += self.STATUS_SKIP_TEMPLATE % (self._skip_n, load)
+                self._last_status_msg = status_msg
+                self.status_bar.showMessage(status_msg)
+        
+        self._processing_budget = 0.9 * self._processing_budget + 0.1 * processing_time
+        self._skip_n = self._frames_per_inference()
+        self._on_inference_done()
+    
+    def on_inference_error(self, message):
+        """Report a frame the pose processor failed on, then carry on with the next"""
+        if self.inference_worker is None:
+            return  # Error from a session that has since been stopped
+        self._report_runtime_error(message)
+        self._on_inference_done()
+    
+    def _on_inference_done(self):
+        """Pump the next frame once a submitted frame has a result or has failed"""
+        # Recordings are analysed back to back; the capture thread is waiting
+        # for this slot to be taken. A dead camera is noticed here too.
+        if not self._is_live_source or self.capture_worker.source_ended:
+            self.update_frame()
+    
+    def _report_runtime_error(self, message):
+        """
+        Logs a per-frame error and flashes it in the status bar.
+        
+        Errors in the frame pipeline tend to repeat every frame, so the same
+        message is only reported again once ERROR_REPEAT_INTERVAL_NS has passed.
+        A modal dialog would stall the pipeline, so they are kept for errors
+        the user caused directly (e.g. a source that won't open).
+        """
+        now_ns = time.monotonic_ns()
+        last_message, last_ns = self._last_error
+        if message == last_message and now_ns - last_ns < self.ERROR_REPEAT_INTERVAL_NS:
+            return
+        self._last_error = (message, now_ns)
+        logger.error(message)
+        self.status_bar.showMessage(f"⚠️ {message}", 2000)
+    
+    def _count_display_frame(self):
+        """
+        Updates the EMA of the displayed frame rate.
+        
+        The processor's own fps only counts inference frames, so with frame
+        skipping it would understate what the user actually sees.
+        """
+        now_ns = time.perf_counter_ns()
+        if self._last_frame_ns:
+            dt_ns = now_ns - self._last_frame_ns
+            if dt_ns > 0:
+                instant_fps = 1e9 / dt_ns
+                if self._display_fps:
+                    self._display_fps = 0.9 * self._display_fps + 0.1 * instant_fps
+                else:
+                    self._display_fps = instant_fps
+        self._last_frame_ns = now_ns
+    
+    def _frames_per_inference(self):
+        """How many frames to advance per pose inference given recent processing cost"""
+        skip_n = max(1, int(self.current_settings.get('skip_frames_base', 1)))
+        # Only live cameras adapt to load; recordings keep their configured rate
+        if self._is_live_source:
+            load = self._processing_budget * 1000 / self.FRAME_INTERVAL_MS
+            skip_n = max(skip_n, math.ceil(load))
+        return skip_n
+    
+    def _video_visible(self):
+        """Whether any of the video label is on screen"""
+        return (not self.isMinimized() and self.video_label.isVisible()
+                and not self.video_label.visibleRegion().isEmpty())
     
     def display_frame_improved(self, frame):
         """Enhanced frame display with better window filling"""
+        # Nothing to draw into while minimized or on another screen of the stack
+        if not self._video_visible():
+            return
+        
         try:
-            h, w, ch = frame.shape
-            
-            if ch == 3:
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                bytes_per_line = ch * w
-                q_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            else:
-                bytes_per_line = ch * w
-                q_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_BGR888)
-            
-            pixmap = QPixmap.fromImage(q_image)
-            
-            # Get the actual available space in the video label
-            label_size = self.video_label.size()
-            
-            # Scale to fit the available space while maintaining aspect ratio
-            if label_size.width() > 0 and label_size.height() > 0:
-                scaled_pixmap = pixmap.scaled(
-                    label_size, 
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                )
-                self.video_label.setPixmap(scaled_pixmap)
+            if frame.ndim == 2:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+            
+            # Fit the frame to the label keeping aspect ratio; resizing in OpenCV
+            # means Qt neither converts to RGB nor rescales the pixmap. The target
+            # size only changes when the label or the source resolution does.
+            h, w = frame.shape[:2]
+            geometry = self._display_geometry
+            if geometry is None or geometry[0] != w or geometry[1] != h:
+                # Fit inside the border, or the pixmap's size hint grows the label
+                contents = self.video_label.contentsRect()
+                label_w, label_h = contents.width(), contents.height()
+                if label_w <= 0 or label_h <= 0:
+                    return
+                scale = min(label_w / w, label_h / h)
+                dst_w, dst_h = max(1, int(w * scale)), max(1, int(h * scale))
+                # INTER_AREA avoids aliasing when shrinking the frame
+                interpolation = cv2.INTER_AREA if dst_w < w else cv2.INTER_LINEAR
+                geometry = (w, h, dst_w, dst_h, interpolation)
+                self._display_geometry = geometry
+            _, _, dst_w, dst_h, interpolation = geometry
+            
+            if self._display_buffer is None or self._display_buffer.shape[:2] != (dst_h, dst_w):
+                self._display_buffer = np.empty((dst_h, dst_w, 3), dtype=np.uint8)
+                # Wraps the buffer without copying, so it shows whatever was last resized into it
+                self._display_image = QImage(self._display_buffer.data, dst_w, dst_h, dst_w * 3,
+                                             DISPLAY_IMAGE_FORMAT)
+            cv2.resize(frame, (dst_w, dst_h), dst=self._display_buffer,
+                       interpolation=interpolation)
+            
+            # QPixmap.fromImage copies the pixels, so the buffer can be reused next frame
+            self.video_label.setPixmap(QPixmap.fromImage(self._display_image, NO_FORMAT_CONVERSION))
             
         except Exception as e:
-            print(f"Error displaying frame: {e}")
+            self._report_runtime_error(f"Error displaying frame: {e}")
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize and obj is self.video_label:
+            self._display_geometry = None
+        return super().eventFilter(obj, event)
     
     def display_comprehensive_analysis(self, analysis: dict):
         """FIXED: Display analysis with proper data extraction"""
@@ -1609,78 +1819,42 @@ class MainWindow(QMainWindow):
             self.depth_widget.setValue(depth_rating)
 
             # Phase - user-friendly
-            phase_map = {
-                'bottom': 'Bottom',
-                'descent': 'Down',
-                'ascent': 'Up',
-                'standing': 'Ready',
-                'ready': 'Ready',
-            }
             phase = analysis.get('phase', '').lower()
-            friendly_phase = phase_map.get(phase, phase.capitalize() if phase else '--')
+            friendly_phase = self.PHASE_LABELS.get(phase, phase.capitalize() if phase else '--')
             self.phase_widget.setValue(friendly_phase)
             
             # Enhanced feedback display with reduced items and smaller fonts
             feedback = analysis.get('feedback', [])
             faults = analysis.get('faults', [])
+            recommendations = analysis.get('recommendations', [])
             
-            feedback_html = f"""
-            <div style='font-family: Arial; color: #e0e0e0; line-height: 1.4; font-size: 15px;'>
-                <h2 style='color: #4CAF50; text-align: center; margin: 0 0 12px 0; font-size: 20px; font-weight: bold;'>
-                    Rep Analysis: {overall_score:.1f}%
-                </h2>
-            """
-
+            html_parts = [REP_ANALYSIS_HEADER_HTML.format(score=overall_score)]
             if faults:
-                feedback_html += """
-                <div style='background: rgba(244, 67, 54, 0.18); padding: 12px; border-radius: 8px; margin-bottom: 12px; border: 2px solid #FF5252;'>
-                    <h3 style='color: #FF1744; margin: 0 0 10px 0; font-size: 18px; font-weight: bold; letter-spacing: 1px;'>
-                        ⚠️ Key Issues
-                    </h3>
-                    <ul style='margin: 0; padding-left: 22px; font-size: 15px; font-weight: bold;'>
-                """
-                for fault in faults[:2]:
-                    feedback_html += f"<li style='color: #FF8A80; margin-bottom: 6px;'>{fault}</li>"
-                feedback_html += "</ul></div>"
-
+                html_parts.append(FAULTS_SECTION_HTML)
+                html_parts.extend(FAULT_ITEM_HTML.format(fault) for fault in faults[:2])
+                html_parts.append(SECTION_END_HTML)
             if feedback:
-                feedback_html += """
-                <div style='background: rgba(33, 150, 243, 0.10); padding: 10px; border-radius: 8px; margin-bottom: 10px;'>
-                    <h3 style='color: #2196F3; margin: 0 0 8px 0; font-size: 16px; font-weight: bold;'>💡 Tips</h3>
-                    <ul style='margin: 0; padding-left: 20px; font-size: 14px;'>
-                """
-                for tip in feedback[:2]:
-                    feedback_html += f"<li style='color: #B2DFDB; margin-bottom: 4px;'>{tip}</li>"
-                feedback_html += "</ul></div>"
-
-            recommendations = analysis.get('recommendations', [])
+                html_parts.append(TIPS_SECTION_HTML)
+                html_parts.extend(TIP_ITEM_HTML.format(tip) for tip in feedback[:2])
+                html_parts.append(SECTION_END_HTML)
             if recommendations:
-                feedback_html += """
-                <div style='background: rgba(156, 39, 176, 0.10); padding: 10px; border-radius: 8px;'>
-                    <h3 style='color: #9C27B0; margin: 0 0 8px 0; font-size: 16px; font-weight: bold;'>🎯 Focus</h3>
-                    <ul style='margin: 0; padding-left: 20px; font-size: 14px;'>
-                """
-                for rec in recommendations[:2]:
-                    feedback_html += f"<li style='color: #CE93D8; margin-bottom: 4px;'>{rec}</li>"
-                feedback_html += "</ul></div>"
-
+                html_parts.append(FOCUS_SECTION_HTML)
+                html_parts.extend(FOCUS_ITEM_HTML.format(rec) for rec in recommendations[:2])
+                html_parts.append(SECTION_END_HTML)
             if not faults and not feedback and not recommendations:
-                feedback_html += """
-                <div style='background: rgba(76, 175, 80, 0.12); padding: 18px; border-radius: 8px; text-align: center;'>
-                    <p style='color: #4CAF50; margin: 0; font-size: 18px; font-weight: bold;'>✨ Excellent form!</p>
-                </div>
-                """
-
-            feedback_html += "</div>"
+                html_parts.append(EXCELLENT_FORM_HTML)
+            html_parts.append("</div>")
+            feedback_html = "".join(html_parts)
 
             # Enhanced feedback display integration
             self._update_enhanced_feedback_display(analysis)
 
             self.feedback_display.setHtml(feedback_html)
-            self.rep_analysis_display_timer.start(10000)  # Show longer for better readability
+            # Show longer for better readability; on_live_metrics clears it afterwards
+            self._rep_display_until = time.perf_counter() + self.REP_ANALYSIS_DISPLAY_S
             
         except Exception as e:
-            print(f"❌ Error in display_comprehensive_analysis: {e}")
+            logger.error("Error in display_comprehensive_analysis: %s", e)
     
     def _update_enhanced_feedback_display(self, analysis: dict):
         """Update enhanced feedback status display"""
@@ -1690,23 +1864,9 @@ class MainWindow(QMainWindow):
             if enhanced_feedback:
                 # Update voice status
                 if enhanced_feedback.get('status') == 'success':
-                    self.voice_status_label.setText("🔊 Voice: Active")
-                    self.voice_status_label.setStyleSheet("""
-                        QLabel {
-                            color: #4CAF50; font-weight: bold; font-size: 12px;
-                            padding: 4px 8px; background-color: rgba(76, 175, 80, 0.1);
-                            border-radius: 4px; border: 1px solid rgba(76, 175, 80, 0.3);
-                        }
-                    """)
+                    self._set_voice_status("🔊 Voice: Active", 'active')
                 else:
-                    self.voice_status_label.setText("⚠️ Voice: Error")
-                    self.voice_status_label.setStyleSheet("""
-                        QLabel {
-                            color: #FF9800; font-weight: bold; font-size: 12px;
-                            padding: 4px 8px; background-color: rgba(255, 152, 0, 0.1);
-                            border-radius: 4px; border: 1px solid rgba(255, 152, 0, 0.3);
-                        }
-                    """)
+                    self._set_voice_status("⚠️ Voice: Error", 'error')
                 
                 # Update feedback statistics
                 msg_count = enhanced_feedback.get('messages_generated', 0)
@@ -1721,40 +1881,37 @@ class MainWindow(QMainWindow):
             else:
                 # No enhanced feedback available
                 if self.voice_feedback_button.isChecked():
-                    self.voice_status_label.setText("🔊 Voice: Ready")
+                    self._set_voice_status("🔊 Voice: Ready", 'active')
                 else:
-                    self.voice_status_label.setText("🔇 Voice: OFF")
-                    self.voice_status_label.setStyleSheet("""
-                        QLabel {
-                            color: #757575; font-weight: bold; font-size: 12px;
-                            padding: 4px 8px; background-color: rgba(117, 117, 117, 0.1);
-                            border-radius: 4px; border: 1px solid rgba(117, 117, 117, 0.3);
-                        }
-                    """)
+                    self._set_voice_status("🔇 Voice: OFF", 'off')
                     
         except Exception as e:
-            print(f"Error updating enhanced feedback display: {e}")
+            logger.error("Error updating enhanced feedback display: %s", e)
+    
+    def _set_rep_flash(self, flash: bool):
+        """Toggle the rep counter highlight via its 'flash' property, repolishing only on change"""
+        if flash == self._rep_flash:
+            return
+        self._rep_flash = flash
+        self.rep_label.setProperty("flash", flash)
+        style = self.rep_label.style()
+        style.unpolish(self.rep_label)
+        style.polish(self.rep_label)
+    
+    def _set_voice_status(self, text: str, bucket: str):
+        """Update the voice status label, restyling only when the state bucket changes"""
+        self.voice_status_label.setText(text)
+        if bucket != self._voice_status_bucket:
+            self.voice_status_label.setStyleSheet(self.VOICE_STATUS_STYLES[bucket])
+            self._voice_status_bucket = bucket
     
     def update_rep_display(self, rep_count):
         """Manually update rep display with better visual feedback"""
         try:
             self.rep_label.setText(str(rep_count))
             
-            # Ensure the label is visible and properly styled
-            self.rep_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 32px;
-                    font-weight: 900;
-                    background: transparent;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 2px;
-                    min-height: 35px;
-                    text-align: center;
-                    font-family: 'Arial Black', Arial, sans-serif;
-                }
-            """)
+            # Ensure the label is visible and not left highlighted
+            self._set_rep_flash(False)
             
             # Force a repaint to make sure the update is visible
             self.rep_label.repaint()
@@ -1772,13 +1929,12 @@ class MainWindow(QMainWindow):
             self.stability_progress.setValue(0)
 
             # Update feedback with rep completion
-            if hasattr(self, 'rep_label'):
-                current_reps = int(self.rep_label.text())
-                self.feedback_display.append(f"""
-                    <div style='color: #4CAF50; font-size: 10px; margin: 4px 0;'>
-                        ✅ Rep {current_reps} completed - Ready for next rep
-                    </div>
-                """)
+            current_reps = int(self.rep_label.text())
+            self.feedback_display.append(f"""
+                <div style='color: #4CAF50; font-size: 10px; margin: 4px 0;'>
+                    ✅ Rep {current_reps} completed - Ready for next rep
+                </div>
+            """)
             
         except Exception as e:
             # Fallback to simple clear
@@ -1814,8 +1970,7 @@ class MainWindow(QMainWindow):
             self.phase_widget.setValue("Ready")
 
             # Reset session data
-            if hasattr(self.session_manager, 'reset_session'):
-                self.session_manager.reset_session()
+            self.session_manager.reset_session()
             
             # Reset session feedback messages
             self.session_feedback_messages = []
@@ -1823,8 +1978,7 @@ class MainWindow(QMainWindow):
             self.session_duration = 0
                 
             # Reset pose processor if available
-            if hasattr(self, 'pose_processor') and hasattr(self.pose_processor, 'reset'):
-                self.pose_processor.reset()
+            self._apply_to_pose_processor(self.pose_processor.reset)
 
             # Reset progress tracking
             self._prev_scores = {'overall': None, 'safety': None, 'depth': None, 'stability': None}
@@ -1878,30 +2032,23 @@ class MainWindow(QMainWindow):
             return "--"
             
         except Exception as e:
-            print(f"Error calculating ROM: {e}")
+            logger.error("Error calculating ROM: %s", e)
             return "--"
     
     def _calculate_live_depth_rating(self, live_metrics):
         """Calculate depth rating based on current pose data - REAL-TIME"""
         try:
             # Get current phase for context
-            phase = live_metrics.get('phase', 'ready').lower()
+            phase = live_metrics.phase.lower()
             
             # If not in a movement phase, show ready state
             if phase in ['ready', 'standing']:
                 return "Ready"
             
-            # Get current pose landmarks for real-time angle calculation
-            pose_data = live_metrics.get('pose_data', {})
-            landmarks = live_metrics.get('landmarks')
-            
-            # Try to get knee angles from live pose data
-            angles = live_metrics.get('angles', {})
-            left_knee = angles.get('knee_angle_left', 180)
-            right_knee = angles.get('knee_angle_right', 180)
-            
-            # Use the minimum (deepest) knee angle for depth assessment
-            min_knee_angle = min(left_knee, right_knee)
+            # The processor reports the minimum (deepest) knee angle for depth assessment
+            min_knee_angle = live_metrics.knee_angle
+            if min_knee_angle is None:
+                return self._phase_depth_estimate(phase)
             
             # Convert knee angle to depth rating (lower angles = deeper squats)
             if min_knee_angle <= 90:
@@ -1915,66 +2062,62 @@ class MainWindow(QMainWindow):
             else:
                 depth_rating = "Shallow"   # Needs improvement - barely squatting
             
-            # Debug: Print depth info occasionally (every 30 frames)
-            import random
-            if random.randint(1, 30) == 1:
-                print(f"🔍 Live Depth: {depth_rating} (knee: {min_knee_angle:.1f}°, phase: {phase})")
+            logger.debug("Live depth: %s (knee: %.1f°, phase: %s)", depth_rating, min_knee_angle, phase)
             
             return depth_rating
                 
         except Exception as e:
             # Fallback to phase-based estimation if angle calculation fails
-            phase = live_metrics.get('phase', 'ready').lower()
-            if phase == 'bottom':
-                return "Good"      # Assume good depth at bottom
-            elif phase == 'descent':
-                return "Going"     # In progress
-            elif phase == 'ascent':
-                return "Done"      # Coming back up
-            else:
-                return "Ready"     # Default state
+            return self._phase_depth_estimate(live_metrics.phase.lower())
+    
+    def _phase_depth_estimate(self, phase):
+        """Depth label guessed from the movement phase when no knee angle is available"""
+        if phase == 'bottom':
+            return "Good"      # Assume good depth at bottom
+        elif phase == 'descent':
+            return "Going"     # In progress
+        elif phase == 'ascent':
+            return "Done"      # Coming back up
+        else:
+            return "Ready"     # Default state
 
     # === REMAINING METHODS (keeping existing implementations) ===
-    def on_difficulty_changed(self, text: str):
+    def on_difficulty_changed(self, index: int):
         """Handle difficulty level changes with proper skill mapping"""
-        difficulty = text.lower()
-        
-        # UPDATED: Map UI difficulty levels to form grader skill levels
-        skill_mapping = {
-            "beginner": UserLevel.BEGINNER,
-            "casual": UserLevel.INTERMEDIATE,     # casual → intermediate  
-            "professional": UserLevel.ADVANCED,  # professional → advanced
-            "expert": UserLevel.EXPERT           # expert → expert
-        }
+        # Each combo item carries its grader difficulty and skill level
+        difficulty, new_skill_level = self.difficulty_combo.itemData(index)
         
         # Update user profile skill level
-        new_skill_level = skill_mapping.get(difficulty, UserLevel.INTERMEDIATE)
         self.user_profile.skill_level = new_skill_level
         
         # FIXED: Update existing form_grader instead of recreating entire PoseProcessor
         try:
-            if hasattr(self.pose_processor, 'form_grader') and self.pose_processor.form_grader:
-                # Update the existing form_grader difficulty (preserves session state)
-                old_difficulty = self.pose_processor.form_grader.difficulty
-                self.pose_processor.form_grader.set_difficulty(difficulty)
-                
-                # Log difficulty change for CSV tracking
-                if hasattr(self.pose_processor, 'data_logger'):
-                    self.pose_processor.data_logger.log_difficulty_change(old_difficulty, difficulty)
+            pose_processor = self.pose_processor
+            if pose_processor.form_grader is not None:
+                def apply_difficulty():
+                    # Update the existing form_grader difficulty (preserves session state)
+                    old_difficulty = pose_processor.form_grader.difficulty
+                    pose_processor.form_grader.set_difficulty(difficulty)
+                    
+                    # Log difficulty change for CSV tracking
+                    pose_processor.data_logger.log_difficulty_change(old_difficulty, difficulty)
                 
-                print(f"Difficulty changed to: {difficulty} (Skill Level: {new_skill_level.value})")
+                self._apply_to_pose_processor(apply_difficulty)
+                logger.info("Difficulty changed to: %s (Skill Level: %s)", difficulty, new_skill_level.value)
             else:
                 # Only recreate if no form_grader exists
-                self.pose_processor = PoseProcessor(
+                self._set_pose_processor(PoseProcessor(
                     user_profile=self.user_profile,
                     threshold_config=self.threshold_config
-                )
-                print(f"Difficulty changed to: {difficulty} (Skill Level: {new_skill_level.value}) - New PoseProcessor created")
+                ))
+                logger.info("Difficulty changed to: %s (Skill Level: %s) - New PoseProcessor created",
+                            difficulty, new_skill_level.value)
         except Exception as e:
-            print(f"Error updating difficulty: {e}")
+            logger.error("Error updating difficulty: %s", e)
             # Fallback - just change the form grader difficulty if pose processor update fails
-            if hasattr(self.pose_processor, 'form_grader'):
-                self.pose_processor.form_grader.set_difficulty(difficulty)
+            form_grader = self.pose_processor.form_grader
+            if form_grader is not None:
+                self._apply_to_pose_processor(lambda: form_grader.set_difficulty(difficulty))
     
     def toggle_voice_feedback(self):
         """Toggle voice feedback on/off"""
@@ -1990,15 +2133,15 @@ class MainWindow(QMainWindow):
                 self.status_bar.showMessage("🔇 Voice feedback disabled", 3000)
             
             # Update the form grader voice setting if available
-            if (hasattr(self.pose_processor, 'form_grader') and 
-                hasattr(self.pose_processor.form_grader, 'set_voice_feedback_enabled')):
-                self.pose_processor.form_grader.set_voice_feedback_enabled(is_enabled)
-                print(f"Voice feedback {'enabled' if is_enabled else 'disabled'}")
+            form_grader = self.pose_processor.form_grader
+            if form_grader is not None:
+                self._apply_to_pose_processor(lambda: form_grader.set_voice_feedback_enabled(is_enabled))
+                logger.info("Voice feedback %s", 'enabled' if is_enabled else 'disabled')
             else:
-                print("Enhanced feedback system not available")
+                logger.warning("Enhanced feedback system not available")
                 
         except Exception as e:
-            print(f"Error toggling voice feedback: {e}")
+            logger.error("Error toggling voice feedback: %s", e)
             self.status_bar.showMessage(f"❌ Error: {e}", 5000)
     
     def show_enhanced_session_report(self):
@@ -2033,7 +2176,7 @@ class MainWindow(QMainWindow):
             unique_recommendations = list(set(all_recommendations))[:3]  # Top 3 recommendations
             
             # Create enhanced HTML report
-            report_html = f"""
+            report_parts = [f"""
             <html>
             <head>
                 <style>
@@ -2135,84 +2278,84 @@ class MainWindow(QMainWindow):
                         </div>
                     </div>
                 </div>
-            """
+            """]
             
             # Add feedback messages section
             if self.session_feedback_messages:
-                report_html += """
+                report_parts.append("""
                 <div class="section">
                     <h2>💬 Rep-by-Rep Performance</h2>
-                """
+                """)
                 
                 for msg in self.session_feedback_messages[-5:]:  # Last 5 reps
                     tempo_display = f"{msg['tempo']:.1f}s" if msg['tempo'] > 0 else "N/A"
-                    report_html += f"""
+                    report_parts.append(f"""
                     <div class="feedback-item">
                         <strong>Rep {msg['rep_number']} - Overall: {msg['overall_score']:.1f}% | Tempo: {tempo_display}</strong>
                         <br>Safety: {msg['safety_score']:.1f}% | Depth: {msg['depth_score']:.1f}% | Stability: {msg['stability_score']:.1f}%
                     </div>
-                    """
+                    """)
                 
-                report_html += "</div>"
+                report_parts.append("</div>")
             
             # Add key issues section
             if unique_faults:
-                report_html += """
+                report_parts.append("""
                 <div class="section">
                     <h2>⚠️ Key Areas for Improvement</h2>
-                """
+                """)
                 for fault in unique_faults:
-                    report_html += f'<div class="feedback-item fault-item">• {fault}</div>'
-                report_html += "</div>"
+                    report_parts.append(f'<div class="feedback-item fault-item">• {fault}</div>')
+                report_parts.append("</div>")
             
             # Add tips section
             if unique_feedback:
-                report_html += """
+                report_parts.append("""
                 <div class="section">
                     <h2>💡 Key Tips from This Session</h2>
-                """
+                """)
                 for tip in unique_feedback:
-                    report_html += f'<div class="feedback-item tip-item">• {tip}</div>'
-                report_html += "</div>"
+                    report_parts.append(f'<div class="feedback-item tip-item">• {tip}</div>')
+                report_parts.append("</div>")
             
             # Add recommendations section
             if unique_recommendations:
-                report_html += """
+                report_parts.append("""
                 <div class="section">
                     <h2>🎯 Recommendations</h2>
-                """
+                """)
                 for rec in unique_recommendations:
-                    report_html += f'<div class="feedback-item">• {rec}</div>'
-                report_html += "</div>"
+                    report_parts.append(f'<div class="feedback-item">• {rec}</div>')
+                report_parts.append("</div>")
             
-            report_html += """
+            report_parts.append("""
                 <div class="section">
                     <h2>🚀 Next Session Goals</h2>
                     <div class="feedback-item">
-            """
+            """)
             
             # Generate personalized goals
             if avg_overall < 70:
-                report_html += "• Focus on fundamental form improvements<br>"
+                report_parts.append("• Focus on fundamental form improvements<br>")
             if avg_safety < 75:
-                report_html += "• Pay attention to back posture and joint alignment<br>"
+                report_parts.append("• Pay attention to back posture and joint alignment<br>")
             if avg_depth < 80:
-                report_html += "• Work on achieving better squat depth<br>"
+                report_parts.append("• Work on achieving better squat depth<br>")
             if avg_stability < 75:
-                report_html += "• Practice balance and core stability<br>"
+                report_parts.append("• Practice balance and core stability<br>")
             if avg_tempo > 4.0:
-                report_html += "• Try to increase tempo for more dynamic movement<br>"
+                report_parts.append("• Try to increase tempo for more dynamic movement<br>")
             elif avg_tempo < 2.0 and avg_tempo > 0:
-                report_html += "• Slow down for better control and form<br>"
+                report_parts.append("• Slow down for better control and form<br>")
             
-            report_html += """
+            report_parts.append("""
                         • Aim to complete more reps with consistent form<br>
                         • Review feedback tips and implement gradually
                     </div>
                 </div>
             </body>
             </html>
-            """
+            """)
             
             # Show in dialog
             from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout
@@ -2231,7 +2374,7 @@ class MainWindow(QMainWindow):
             
             # Report display
             report_display = QTextEdit()
-            report_display.setHtml(report_html)
+            report_display.setHtml("".join(report_parts))
             report_display.setReadOnly(True)
             report_display.setStyleSheet("""
                 QTextEdit {
@@ -2271,7 +2414,7 @@ class MainWindow(QMainWindow):
             dialog.exec()
             
         except Exception as e:
-            print(f"Error showing enhanced session report: {e}")
+            logger.error("Error showing enhanced session report: %s", e)
             # Fallback to basic message
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "Session Complete", 
@@ -2282,28 +2425,56 @@ class MainWindow(QMainWindow):
         if not report_data or report_data.get('total_reps', 0) == 0:
             QMessageBox.information(self, "Session Report", "No reps were completed in the session.")
             return
+        from src.gui.widgets.session_report import SessionReportDialog
         dialog = SessionReportDialog(report_data, self)
         dialog.exec()
     
+    def _set_pose_processor(self, pose_processor):
+        """Replace the pose processor, keeping a running inference worker in sync"""
+        self.pose_processor = pose_processor
+        if self.inference_worker:
+            self.inference_worker.pose_processor = pose_processor
+    
+    def _apply_to_pose_processor(self, change):
+        """
+        Run a change to pose processor state between frames on the inference
+        thread, so it never lands halfway through process_frame.
+        """
+        if self.inference_worker:
+            self.inference_worker.call_between_frames(change)
+        else:
+            change()
+    
     def toggle_validation_mode(self, enabled):
         try:
-            self.pose_processor = PoseProcessor(
-                user_profile=self.user_profile,
-                enable_validation=enabled
-            )
+            pose_processor = self.pose_processor
+            self._apply_to_pose_processor(lambda: pose_processor.set_validation(enabled))
             status_text = "Validation mode enabled" if enabled else "Validation mode disabled"
             self.status_bar.showMessage(status_text, 3000)
         except Exception as e:
-            print(f"Error toggling validation mode: {e}")
+            logger.error("Error toggling validation mode: %s", e)
             self.validation_action.setChecked(not enabled)
     
+    def toggle_pose_model(self, enabled):
+        """Switch between the Lite and Full MediaPipe pose models."""
+        self.current_settings['mediapipe_model_complexity'] = 1 if enabled else 0
+        self.config_manager.update_analysis_settings(self.current_settings)
+        self.pose_processor.update_settings(self.current_settings)
+        model_name = "Full" if enabled else "Lite"
+        self.status_bar.showMessage(f"Pose model set to {model_name}", 3000)
+    
     def closeEvent(self, event):
+        size = self.size()
+        # Hide first so the window goes away while the workers and logger wind down
+        self._closing = True
+        self.hide()
         self.stop_session()
-        self.config_manager.save_ui_settings({'window_width': self.width(), 'window_height': self.height()})
+        self.config_manager.save_ui_settings({'window_width': size.width(), 'window_height': size.height()})
         event.accept()
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    app.setStyleSheet(load_app_stylesheet())
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
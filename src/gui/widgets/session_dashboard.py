@@ -3,11 +3,15 @@
 Session Dashboard Widget - Real-time visual dashboard for session progress
 """
 
+import logging
+
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QFrame, QGridLayout, QSizePolicy)
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QLinearGradient
 
+logger = logging.getLogger(__name__)
+
 
 class StatCardWidget(QFrame):
     """Modern stat card with icon and value"""
@@ -344,8 +348,8 @@ SESSION STATISTICS:
 REP-BY-REP SCORES:
 """
             
-            for i, score in enumerate(summary['rep_scores'], 1):
-                export_text += f"Rep {i:2d}: {score:5.1f}\n"
+            export_text += "".join(f"Rep {i:2d}: {score:5.1f}\n"
+                                   for i, score in enumerate(summary['rep_scores'], 1))
             
             export_text += f"""
 PERFORMANCE ANALYSIS:
@@ -375,4 +379,4 @@ RECOMMENDATIONS:
             
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Failed to export session data:\n{str(e)}")
-            print(f"Error exporting session data: {e}")
+            logger.error("Error exporting session data: %s", e)
@@ -2,10 +2,65 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                QPushButton, QTextEdit, QScrollArea, QWidget,
                                QGridLayout, QProgressBar, QFrame, QSplitter,
                                QTabWidget)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThread, Signal
 from PySide6.QtGui import QFont, QPalette
 import time
 import json
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+
+CATEGORY_ICONS = {
+    'safety': '⚠️',
+    'form': '💡',
+    'encouragement': '👍',
+    'general': '📋'
+}
+
+
+@lru_cache(maxsize=64)
+def format_feedback(category, message):
+    """Prefix a feedback message with its category icon (cached, messages repeat often)"""
+    return f"{CATEGORY_ICONS.get(category, '📋')} {message}"
+
+
+def _session_clock(timestamp, start_time):
+    """Formats a feedback timestamp as HH:MM:SS into the session, with integer math only"""
+    if not isinstance(timestamp, (int, float)) or not start_time:
+        return ''
+    minutes, seconds = divmod(max(0, int(timestamp - start_time)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def _json_default(value):
+    """Serialise the non-JSON types found in session data (fault sets, enums, ...)"""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, deque):
+        return list(value)
+    if hasattr(value, 'tolist'):  # NumPy scalars/arrays when orjson isn't installed
+        return value.tolist()
+    return str(value)
+
+
+class _ExportWorker(QThread):
+    """Runs an export's file writing off the GUI thread and reports the outcome."""
+    succeeded = Signal(str)  # filename
+    failed = Signal(str)     # error message
+
+    def __init__(self, write, filename, parent=None):
+        super().__init__(parent)
+        self._write = write
+        self._filename = filename
+
+    def run(self):
+        try:
+            self._write(self._filename)
+            self.succeeded.emit(self._filename)
+        except Exception as e:
+            self.failed.emit(str(e))
+
 
 class SessionReportDialog(QDialog):
     """Comprehensive session report and analytics"""
@@ -13,6 +68,10 @@ class SessionReportDialog(QDialog):
     def __init__(self, session_data, parent=None):
         super().__init__(parent)
         self.session_data = session_data
+        # The dialog shows a fixed snapshot, so exports are serialised once and reused
+        self._json_export = None
+        self._csv_summary_rows = None
+        self._export_workers = set()  # Keeps running export threads alive
         self.setWindowTitle("Session Report & Analytics")
         self.setModal(True)
         self.resize(800, 600)
@@ -255,8 +314,10 @@ class SessionReportDialog(QDialog):
         
         # Performance assessment - now based on actual movement data
         if len(form_scores) > 0:
-            # Calculate worst score for range analysis
-            worst_score = min(form_scores)
+            # Worst score for range analysis; SessionManager precomputes it
+            worst_score = self.session_data.get('worst_form_score')
+            if worst_score is None:
+                worst_score = min(form_scores)
             score_consistency = best_score - worst_score
             
             if avg_score >= 90:
@@ -348,12 +409,22 @@ class SessionReportDialog(QDialog):
         if form_scores:
             quality_analysis.append(f"📊 FORM SCORE ANALYSIS")
             quality_analysis.append(f"Total scored frames: {len(form_scores)}")
-            quality_analysis.append(f"Score range: {min(form_scores):.1f}% - {max(form_scores):.1f}%")
+            worst_score = self.session_data.get('worst_form_score')
+            best_score = self.session_data.get('best_form_score')
+            if worst_score is None or best_score is None:
+                worst_score, best_score = min(form_scores), max(form_scores)
+            quality_analysis.append(f"Score range: {worst_score:.1f}% - {best_score:.1f}%")
             
-            # Score distribution
-            excellent_frames = len([s for s in form_scores if s >= 90])
-            good_frames = len([s for s in form_scores if 70 <= s < 90])
-            poor_frames = len([s for s in form_scores if s < 70])
+            # Score distribution, precomputed by SessionManager when available
+            distribution = self.session_data.get('form_score_distribution')
+            if distribution is not None:
+                excellent_frames = distribution['excellent']
+                good_frames = distribution['good']
+                poor_frames = distribution['needs_work']
+            else:
+                excellent_frames = sum(1 for s in form_scores if s >= 90)
+                good_frames = sum(1 for s in form_scores if 70 <= s < 90)
+                poor_frames = sum(1 for s in form_scores if s < 70)
             
             quality_analysis.append(f"Excellent form (90%+): {excellent_frames} frames ({excellent_frames/len(form_scores)*100:.1f}%)")
             quality_analysis.append(f"Good form (70-89%): {good_frames} frames ({good_frames/len(form_scores)*100:.1f}%)")
@@ -413,14 +484,7 @@ class SessionReportDialog(QDialog):
             message = feedback.get('message', '')
             category = feedback.get('category', 'general')
             
-            category_icon = {
-                'safety': '⚠️',
-                'form': '💡',
-                'encouragement': '👍',
-                'general': '📋'
-            }.get(category, '📋')
-            
-            feedback_text.append(f"[{timestamp}] {category_icon} {message}")
+            feedback_text.append(f"[{timestamp}] {format_feedback(category, message)}")
         
         self.feedback_text.setPlainText('\n'.join(feedback_text))
         
@@ -440,56 +504,84 @@ class SessionReportDialog(QDialog):
         preview_json = json.dumps(preview_data, indent=2)
         self.preview_text.setPlainText(preview_json)
         
+    def _start_export(self, write, filename):
+        """Writes filename on a worker thread, then reports the result in a message box"""
+        from PySide6.QtWidgets import QMessageBox
+        
+        worker = _ExportWorker(write, filename, self)
+        worker.succeeded.connect(
+            lambda name: QMessageBox.information(self, "Success", f"Data exported to {name}"))
+        worker.failed.connect(
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to export data: {error}"))
+        worker.finished.connect(lambda: self._export_workers.discard(worker))
+        self._export_workers.add(worker)
+        worker.start()
+    
+    def done(self, result):
+        # Let any export still writing finish before the dialog (its parent) goes away
+        for worker in list(self._export_workers):
+            worker.wait()
+        super().done(result)
+    
     def export_json(self):
         """Export session data as JSON"""
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
+        from PySide6.QtWidgets import QFileDialog
         
         filename, _ = QFileDialog.getSaveFileName(
             self, "Export Session Data", "session_data.json", "JSON Files (*.json)"
         )
         
         if filename:
-            try:
-                with open(filename, 'w') as f:
-                    json.dump(self.session_data, f, indent=2)
-                QMessageBox.information(self, "Success", f"Data exported to {filename}")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to export data: {str(e)}")
+            self._start_export(self._write_json, filename)
+    
+    def _write_json(self, filename):
+        # Runs on an export worker thread
+        from src.utils import fast_json
+        
+        if self._json_export is None:
+            self._json_export = fast_json.dumps(self.session_data, default=_json_default)
+        with open(filename, 'wb') as f:
+            f.write(self._json_export)
         
     def export_csv(self):
         """Export session data as CSV"""
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        import csv
+        from PySide6.QtWidgets import QFileDialog
         
         filename, _ = QFileDialog.getSaveFileName(
             self, "Export Session Data", "session_data.csv", "CSV Files (*.csv)"
         )
         
         if filename:
-            try:
-                with open(filename, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    
-                    # Write headers and session summary
-                    writer.writerow(['Metric', 'Value'])
-                    writer.writerow(['Total Reps', self.session_data.get('total_reps', 0)])
-                    writer.writerow(['Duration (seconds)', self.session_data.get('duration', 0)])
-                    writer.writerow(['Average Form Score', self.session_data.get('avg_form_score', 0)])
-                    writer.writerow(['Best Form Score', self.session_data.get('best_form_score', 0)])
-                    writer.writerow([])
-                    
-                    # Write feedback history
-                    writer.writerow(['Timestamp', 'Category', 'Message'])
-                    for feedback in self.session_data.get('feedback_history', []):
-                        writer.writerow([
-                            feedback.get('timestamp', ''),
-                            feedback.get('category', ''),
-                            feedback.get('message', '')
-                        ])
-                        
-                QMessageBox.information(self, "Success", f"Data exported to {filename}")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to export data: {str(e)}")
+            self._start_export(self._write_csv, filename)
+    
+    def _write_csv(self, filename):
+        # Runs on an export worker thread
+        import csv
+        
+        if self._csv_summary_rows is None:
+            self._csv_summary_rows = [
+                ('Metric', 'Value'),
+                ('Total Reps', self.session_data.get('total_reps', 0)),
+                ('Duration (seconds)', self.session_data.get('duration', 0)),
+                ('Average Form Score', self.session_data.get('avg_form_score', 0)),
+                ('Best Form Score', self.session_data.get('best_form_score', 0)),
+                (),
+                ('Session Time', 'Timestamp', 'Category', 'Message'),
+            ]
+        
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            
+            # Session summary and headers, then the feedback history
+            writer.writerows(self._csv_summary_rows)
+            start_time = self.session_data.get('start_time')
+            writer.writerows(
+                (_session_clock(feedback.get('timestamp'), start_time),
+                 feedback.get('timestamp', ''),
+                 feedback.get('category', ''),
+                 feedback.get('message', ''))
+                for feedback in self.session_data.get('feedback_history', [])
+            )
         
     def export_report(self):
         """Export a comprehensive text report"""
@@ -532,6 +624,8 @@ class SessionReportDialog(QDialog):
 class SessionManager:
     """Manages session data collection and analysis"""
     
+    MAX_FEEDBACK_HISTORY = 10_000  # Oldest feedback is dropped beyond this
+    
     def __init__(self):
         self.reset_session()
         
@@ -542,7 +636,7 @@ class SessionManager:
             'end_time': None,
             'total_reps': 0,
             'form_scores': [],
-            'feedback_history': [],
+            'feedback_history': deque(maxlen=self.MAX_FEEDBACK_HISTORY),
             'fault_frequency': {},  # Per-frame count (for detailed analysis)
             'phase_transitions': [],
             'phase_durations': {},  # Track time spent in each phase
@@ -550,6 +644,11 @@ class SessionManager:
             'current_rep_faults': set(),  # Tracks unique faults in the current rep
             'faulty_reps': {}  # Tracks which reps had which faults
         }
+        # Running score aggregates, so the summary does not rescan form_scores
+        self._score_total = 0.0
+        self._best_score = 0
+        self._worst_score = 0
+        self._score_distribution = {'excellent': 0, 'good': 0, 'needs_work': 0}
         
     def start_session(self):
         """Start a new session"""
@@ -589,7 +688,7 @@ class SessionManager:
             # Reset the fault tracker for the new rep
             self.session_data['current_rep_faults'] = set()
             # Log the score for the completed rep
-            self.session_data['form_scores'].append(form_score)
+            self._record_score(form_score)
 
         # Now, update the total reps
         self.session_data['total_reps'] = rep_count
@@ -610,7 +709,8 @@ class SessionManager:
                 # Check if this feedback is already recent (within last 2 seconds)
                 is_duplicate = False
                 current_time = feedback.get('timestamp', time.time())
-                for existing in self.session_data['feedback_history'][-5:]:  # Check last 5 entries
+                recent = islice(reversed(self.session_data['feedback_history']), 5)
+                for existing in recent:  # Check last 5 entries
                     if (existing.get('message') == feedback.get('message') and 
                         abs(current_time - existing.get('timestamp', 0)) < 2.0):
                         is_duplicate = True
@@ -624,6 +724,22 @@ class SessionManager:
                 self.session_data['fault_frequency'][fault] = \
                     self.session_data['fault_frequency'].get(fault, 0) + 1
     
+    def _record_score(self, form_score):
+        """Append a rep score and fold it into the running aggregates"""
+        if not self.session_data['form_scores']:
+            self._best_score = self._worst_score = form_score
+        else:
+            self._best_score = max(self._best_score, form_score)
+            self._worst_score = min(self._worst_score, form_score)
+        self.session_data['form_scores'].append(form_score)
+        self._score_total += form_score
+        if form_score >= 90:
+            self._score_distribution['excellent'] += 1
+        elif form_score >= 70:
+            self._score_distribution['good'] += 1
+        else:
+            self._score_distribution['needs_work'] += 1
+    
     def get_session_summary(self):
         """Get session summary for reporting"""
         duration = 0
@@ -632,17 +748,16 @@ class SessionManager:
         elif self.session_data['start_time']:
             duration = time.time() - self.session_data['start_time']
             
-        avg_form_score = 0
-        best_form_score = 0
-        if self.session_data['form_scores']:
-            avg_form_score = sum(self.session_data['form_scores']) / len(self.session_data['form_scores'])
-            best_form_score = max(self.session_data['form_scores'])
+        score_count = len(self.session_data['form_scores'])
+        avg_form_score = self._score_total / score_count if score_count else 0
             
         return {
             **self.session_data,
             'duration': duration,
             'avg_form_score': avg_form_score,
-            'best_form_score': best_form_score
+            'best_form_score': self._best_score,
+            'worst_form_score': self._worst_score,
+            'form_score_distribution': dict(self._score_distribution)
         }
 
     def get_session_data(self):
@@ -1,106 +1,229 @@
 # ai_fitness_coach/src/pose/pose_detector.py
 import mediapipe as mp
 import cv2
+import logging
 import numpy as np
 import math
+import time
+from types import SimpleNamespace
 from typing import Optional, Dict, Any
+from mediapipe.framework.formats import landmark_pb2
+from src.utils.math_utils import joint_angles
+
+logger = logging.getLogger(__name__)
+
+# Key landmark indices for MediaPipe pose
+LEFT_SHOULDER, RIGHT_SHOULDER = 11, 12
+LEFT_HIP, RIGHT_HIP = 23, 24
+LEFT_KNEE, RIGHT_KNEE = 25, 26
+LEFT_ANKLE, RIGHT_ANKLE = 27, 28
+LEFT_HEEL, RIGHT_HEEL = 29, 30
+
+# (A, B, C) triplets for the angle at B, evaluated in one joint_angles() call
+ANGLE_TRIPLETS = np.array([
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),            # knee_left
+    (RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE),         # knee_right
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),         # hip (left)
+    (RIGHT_SHOULDER, RIGHT_HIP, RIGHT_KNEE),      # hip (right)
+    (LEFT_KNEE, LEFT_ANKLE, LEFT_HEEL),           # ankle_left
+    (RIGHT_KNEE, RIGHT_ANKLE, RIGHT_HEEL),        # ankle_right
+], dtype=np.int64)
+
+# Columns of the array returned by PoseDetector.landmark_array
+COL_X, COL_Y, COL_VISIBILITY = 0, 1, 2
+COM_LANDMARKS = [LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP]
+KEY_VISIBILITY_LANDMARKS = [LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP,
+                            LEFT_KNEE, RIGHT_KNEE, LEFT_ANKLE, RIGHT_ANKLE]
+
+# Skeleton overlay: bone endpoints, the landmarks highlighted with a larger
+# marker (head, shoulders, elbows, wrists, hips, knees, ankles), and the
+# visibility below which a landmark is not drawn
+POSE_CONNECTION_PAIRS = np.array(sorted(mp.solutions.pose.POSE_CONNECTIONS), dtype=np.int64)
+KEY_DRAW_LANDMARKS = [0, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28]
+DRAW_VISIBILITY_THRESHOLD = 0.5
 
 class PoseDetector:
-    def __init__(self):
+    def __init__(self, model_complexity=0):
         self.mp_pose = mp.solutions.pose
-        self.mp_drawing = mp.solutions.drawing_utils
         
-        # Optimized settings for better performance and fewer warnings
-        self._pose = self.mp_pose.Pose(
+        self.model_complexity = model_complexity
+        self._pose = self._create_pose(model_complexity)
+        # Optional GPU-delegated PoseLandmarker (MediaPipe Tasks); None = CPU graph above
+        self.gpu_model_path = None
+        self._landmarker = None
+        self._landmarker_ts_ms = 0
+        self.debug_mode = False  # Disable debug by default for performance
+        self.results = None
+        self._array_source = None  # Landmark list the cached array was built from
+        self._array = None
+
+    def _create_pose(self, model_complexity):
+        """Build the MediaPipe Pose graph for a continuous video stream."""
+        # static_image_mode=False keeps the tracker running between frames so the
+        # person detector only re-runs when tracking is lost
+        return self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=0,  # Fastest model
+            model_complexity=model_complexity,  # 0 = Lite (fastest), 1 = Full, 2 = Heavy
             smooth_landmarks=True,
             enable_segmentation=False,  # Disable segmentation for better performance
             min_detection_confidence=0.5,  # Increased for better stability
             min_tracking_confidence=0.5   # Increased for better stability
         )
-        self.debug_mode = False  # Disable debug by default for performance
+
+    def set_model_complexity(self, model_complexity):
+        """Switch the landmark model, rebuilding the graph only when it changes."""
+        if model_complexity == self.model_complexity:
+            return
+        self._pose.close()
+        self._pose = self._create_pose(model_complexity)
+        self.model_complexity = model_complexity
+        self.results = None
+
+    def set_gpu_model(self, model_path):
+        """
+        Run inference with a GPU-delegated PoseLandmarker loaded from model_path
+        (a MediaPipe .task bundle), or on the CPU graph when model_path is empty.
+        
+        The Tasks GPU delegate is not available on every platform (e.g. Windows
+        Python builds); if it cannot be created the CPU graph is kept.
+        """
+        model_path = model_path or None
+        if model_path == self.gpu_model_path:
+            return
+        if self._landmarker is not None:
+            self._landmarker.close()
+            self._landmarker = None
+        self.gpu_model_path = model_path
+        self.results = None
+        if model_path is None:
+            return
+        
+        try:
+            vision = mp.tasks.vision
+            options = vision.PoseLandmarkerOptions(
+                base_options=mp.tasks.BaseOptions(
+                    model_asset_path=model_path,
+                    delegate=mp.tasks.BaseOptions.Delegate.GPU
+                ),
+                running_mode=vision.RunningMode.VIDEO,
+                num_poses=1,
+                min_pose_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+            self._landmarker = vision.PoseLandmarker.create_from_options(options)
+            logger.info("Pose inference on GPU (%s)", model_path)
+        except Exception as e:
+            logger.warning("GPU pose backend unavailable, using CPU: %s", e)
+            self._landmarker = None
+
+    def reset_tracking(self):
+        """Drop the tracked region so the person detector runs on the next frame."""
+        # The Tasks landmarker manages its own tracking and has no reset
+        self._pose.reset()
         self.results = None
 
+    def _process_frame_gpu(self, frame_rgb):
+        """Runs the GPU landmarker and wraps its output like the solutions API's results."""
+        # VIDEO mode needs strictly increasing timestamps
+        timestamp_ms = max(self._landmarker_ts_ms + 1, int(time.monotonic() * 1000))
+        self._landmarker_ts_ms = timestamp_ms
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(frame_rgb))
+        result = self._landmarker.detect_for_video(image, timestamp_ms)
+        
+        if not result.pose_landmarks:
+            return SimpleNamespace(pose_landmarks=None)
+        pose_landmarks = landmark_pb2.NormalizedLandmarkList()
+        for lm in result.pose_landmarks[0]:
+            pose_landmarks.landmark.add(x=lm.x, y=lm.y, z=lm.z, visibility=lm.visibility or 0.0)
+        return SimpleNamespace(pose_landmarks=pose_landmarks)
+
     def process_frame(self, frame_rgb):
         """Processes a frame and stores the results."""
         try:
             # Check if the frame is valid
             if frame_rgb is None or frame_rgb.size == 0:
                 if self.debug_mode:
-                    print("❌ Invalid frame provided to pose detector")
+                    logger.debug("Invalid frame provided to pose detector")
                 return None
                 
             # Process the frame
-            self.results = self._pose.process(frame_rgb)
+            if self._landmarker is not None:
+                self.results = self._process_frame_gpu(frame_rgb)
+            else:
+                self.results = self._pose.process(frame_rgb)
             
             # Optional debug logging
             if self.debug_mode:
                 if self.results and self.results.pose_landmarks:
-                    print("✅ Pose detected successfully!")
+                    logger.debug("Pose detected")
                 else:
-                    print("❌ No pose detected in frame")
+                    logger.debug("No pose detected in frame")
                     
             return self.results
         except Exception as e:
-            print(f"❌ Error in pose detection: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in pose detection: %s", e)
             return None
 
-    def draw_landmarks(self, frame):
-        """Draws the pose landmarks on a given BGR frame."""
-        if self.results and self.results.pose_landmarks:
+    def draw_landmarks(self, frame, pose_landmarks=None):
+        """
+        Draws the pose landmarks on a given BGR frame.
+        
+        pose_landmarks defaults to the last detection result; callers may pass an
+        adjusted NormalizedLandmarkList (e.g. landmarks predicted between frames).
+        """
+        if pose_landmarks is None and self.results:
+            pose_landmarks = self.results.pose_landmarks
+        if pose_landmarks:
             try:
-                # Make a copy of the frame for drawing
                 height, width = frame.shape[:2]
+                points = np.array([(lm.x, lm.y, lm.visibility) for lm in pose_landmarks.landmark],
+                                  dtype=np.float64)
+                pixels = (points[:, :2] * (width, height)).astype(np.int32)
+                # Same rule as mediapipe's drawing_utils: skip low-visibility and off-frame points
+                in_frame = ((points[:, :2] >= 0.0) & (points[:, :2] <= 1.0)).all(axis=1)
+                shown = in_frame & (points[:, COL_VISIBILITY] >= DRAW_VISIBILITY_THRESHOLD)
                 
-                # First, add a slight darkening effect to make landmarks more visible
-                overlay = frame.copy()
-                cv2.addWeighted(overlay, 0.8, frame, 0.2, 0, frame)
+                # Bones: every visible connection in one polylines call - bright green
+                start, end = POSE_CONNECTION_PAIRS[:, 0], POSE_CONNECTION_PAIRS[:, 1]
+                bones = np.stack((pixels[start], pixels[end]), axis=1)[shown[start] & shown[end]]
+                if len(bones):
+                    cv2.polylines(frame, list(bones), False, (0, 255, 0), 6)
                 
-                # Draw landmarks with enhanced visibility
-                self.mp_drawing.draw_landmarks(
-                    frame,
-                    self.results.pose_landmarks,
-                    self.mp_pose.POSE_CONNECTIONS,
-                    # Landmarks (joints) style - bright yellow larger circles
-                    self.mp_drawing.DrawingSpec(
-                        color=(0, 255, 255),  # Bright yellow (BGR format)
-                        thickness=8, 
-                        circle_radius=8
-                    ),
-                    # Connections (bones) style - bright green thicker lines
-                    self.mp_drawing.DrawingSpec(
-                        color=(0, 255, 0),  # Bright green (BGR format)
-                        thickness=6, 
-                        circle_radius=3
-                    )
-                )
+                # Joints: white ring under a bright yellow circle (BGR)
+                for x, y in pixels[shown].tolist():
+                    cv2.circle(frame, (x, y), 9, (255, 255, 255), 8)
+                    cv2.circle(frame, (x, y), 8, (0, 255, 255), 8)
                 
-                # Draw additional large markers for key points to make them more visible
-                landmark_list = self.results.pose_landmarks.landmark
-                for idx, landmark in enumerate(landmark_list):
-                    # Only draw key landmarks bigger
-                    if idx in [0, 11, 12, 13, 14, 15, 16, 23, 24, 25, 26, 27, 28]:  # Head, shoulders, elbows, wrists, hips, knees, ankles
-                        x, y = int(landmark.x * width), int(landmark.y * height)
-                        # Draw a larger circle around important landmarks
-                        cv2.circle(frame, (x, y), 10, (255, 0, 255), -1)  # Filled magenta circle
+                # Larger filled magenta markers on the key landmarks
+                for x, y in pixels[KEY_DRAW_LANDMARKS].tolist():
+                    cv2.circle(frame, (x, y), 10, (255, 0, 255), -1)
                 
                 if self.debug_mode:
-                    print("✅ Landmarks drawn successfully!")
+                    logger.debug("Landmarks drawn")
                 
                 return True
             except Exception as e:
-                print(f"Error drawing landmarks: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error drawing landmarks: %s", e)
                 return False
         
         if self.debug_mode:
-            print("⚠️ No pose landmarks available to draw")
+            logger.debug("No pose landmarks available to draw")
         return False
     
+    def landmark_array(self, landmarks):
+        """
+        Returns the landmarks as an (N, 3) float64 array of x, y, visibility.
+        
+        The array for the most recent landmark list is cached, so the angle,
+        centre of mass and visibility calculations for one frame share a single
+        conversion out of the MediaPipe objects.
+        """
+        if landmarks is not self._array_source:
+            self._array = np.array([(lm.x, lm.y, lm.visibility) for lm in landmarks],
+                                   dtype=np.float64)
+            self._array_source = landmarks
+        return self._array
+
     def calculate_angle(self, point1, point2, point3):
         """
         Calculate angle between three points using vector mathematics.
@@ -143,55 +266,34 @@ class PoseDetector:
             return {}
         
         try:
-            # Key landmark indices for MediaPipe pose
-            LEFT_HIP = 23
-            RIGHT_HIP = 24
-            LEFT_KNEE = 25
-            RIGHT_KNEE = 26
-            LEFT_ANKLE = 27
-            RIGHT_ANKLE = 28
-            LEFT_SHOULDER = 11
-            RIGHT_SHOULDER = 12
-            LEFT_HEEL = 29
-            RIGHT_HEEL = 30
-            
-            angles = {}
-            
-            # Left knee angle (hip-knee-ankle)
-            angles['knee_left'] = self.calculate_angle(
-                landmarks[LEFT_HIP], landmarks[LEFT_KNEE], landmarks[LEFT_ANKLE]
+            points = self.landmark_array(landmarks)
+            knee_left, knee_right, hip_left, hip_right, ankle_left, ankle_right = (
+                joint_angles(points, ANGLE_TRIPLETS)
             )
             
-            # Right knee angle (hip-knee-ankle)
-            angles['knee_right'] = self.calculate_angle(
-                landmarks[RIGHT_HIP], landmarks[RIGHT_KNEE], landmarks[RIGHT_ANKLE]
-            )
+            angles = {
+                'knee_left': knee_left,
+                'knee_right': knee_right,
+            }
             
             # Add average knee angle for rep counter compatibility
-            if angles['knee_left'] > 0 and angles['knee_right'] > 0:
-                angles['knee'] = (angles['knee_left'] + angles['knee_right']) / 2
-            elif angles['knee_left'] > 0:
-                angles['knee'] = angles['knee_left']
-            elif angles['knee_right'] > 0:
-                angles['knee'] = angles['knee_right']
+            if knee_left > 0 and knee_right > 0:
+                angles['knee'] = (knee_left + knee_right) / 2
+            elif knee_left > 0:
+                angles['knee'] = knee_left
+            elif knee_right > 0:
+                angles['knee'] = knee_right
             else:
                 angles['knee'] = 0
             
             # Hip angle (average of left and right)
-            left_hip_angle = self.calculate_angle(
-                landmarks[LEFT_SHOULDER], landmarks[LEFT_HIP], landmarks[LEFT_KNEE]
-            )
-            right_hip_angle = self.calculate_angle(
-                landmarks[RIGHT_SHOULDER], landmarks[RIGHT_HIP], landmarks[RIGHT_KNEE]
-            )
-            angles['hip'] = (left_hip_angle + right_hip_angle) / 2
+            angles['hip'] = (hip_left + hip_right) / 2
             
             # Back angle - measure spine orientation using shoulder and hip midpoints
-            # Calculate midpoints
-            shoulder_mid_x = (landmarks[LEFT_SHOULDER].x + landmarks[RIGHT_SHOULDER].x) / 2
-            shoulder_mid_y = (landmarks[LEFT_SHOULDER].y + landmarks[RIGHT_SHOULDER].y) / 2
-            hip_mid_x = (landmarks[LEFT_HIP].x + landmarks[RIGHT_HIP].x) / 2
-            hip_mid_y = (landmarks[LEFT_HIP].y + landmarks[RIGHT_HIP].y) / 2
+            shoulder_mid_x = (points[LEFT_SHOULDER, 0] + points[RIGHT_SHOULDER, 0]) / 2
+            shoulder_mid_y = (points[LEFT_SHOULDER, 1] + points[RIGHT_SHOULDER, 1]) / 2
+            hip_mid_x = (points[LEFT_HIP, 0] + points[RIGHT_HIP, 0]) / 2
+            hip_mid_y = (points[LEFT_HIP, 1] + points[RIGHT_HIP, 1]) / 2
             
             # Calculate back angle from vertical (180 degrees = perfectly upright)
             dx = hip_mid_x - shoulder_mid_x
@@ -200,12 +302,8 @@ class PoseDetector:
             angles['back'] = math.degrees(back_angle_rad) + 90  # Convert to degrees, 180 = upright
             
             # Ankle angles
-            angles['ankle_left'] = self.calculate_angle(
-                landmarks[LEFT_KNEE], landmarks[LEFT_ANKLE], landmarks[LEFT_HEEL]
-            )
-            angles['ankle_right'] = self.calculate_angle(
-                landmarks[RIGHT_KNEE], landmarks[RIGHT_ANKLE], landmarks[RIGHT_HEEL]
-            )
+            angles['ankle_left'] = ankle_left
+            angles['ankle_right'] = ankle_right
             
             return angles
             
@@ -226,18 +324,10 @@ class PoseDetector:
             return (0.0, 0.0)
         
         try:
-            # Use key body points to estimate COM
-            key_points = [
-                landmarks[11],  # Left shoulder
-                landmarks[12],  # Right shoulder
-                landmarks[23],  # Left hip
-                landmarks[24],  # Right hip
-            ]
-            
-            avg_x = sum(point.x for point in key_points) / len(key_points)
-            avg_y = sum(point.y for point in key_points) / len(key_points)
+            # Use the shoulders and hips to estimate COM
+            avg_x, avg_y = self.landmark_array(landmarks)[COM_LANDMARKS, :COL_VISIBILITY].mean(axis=0)
             
-            return (avg_x, avg_y)
+            return (float(avg_x), float(avg_y))
             
         except:
             return (0.0, 0.0)
@@ -256,10 +346,10 @@ class PoseDetector:
             return 0.0
         
         try:
-            key_landmarks = [11, 12, 23, 24, 25, 26, 27, 28]  # Key points for squat
-            visibilities = [landmarks[i].visibility for i in key_landmarks if i < len(landmarks)]
+            points = self.landmark_array(landmarks)
+            key_landmarks = [i for i in KEY_VISIBILITY_LANDMARKS if i < len(points)]  # Key points for squat
             
-            return sum(visibilities) / len(visibilities) if visibilities else 0.0
+            return float(points[key_landmarks, COL_VISIBILITY].mean()) if key_landmarks else 0.0
             
         except:
             return 0.0
@@ -347,7 +437,7 @@ class PoseDetector:
             
         except (IndexError, KeyError) as e:
             if self.debug_mode:
-                print(f"Warning: Could not calculate some metrics: {e}")
+                logger.debug("Could not calculate some metrics: %s", e)
         
         return {
             'angles': angles,
@@ -3,7 +3,8 @@
 Minimal implementation of the One-Euro Filter
 from Casiez et al. (CHI 2012).
 
-Call  filter(value, t)  for each new sample.
+Call  filter(value, t)  for each new sample. value may be a scalar or a
+NumPy array, in which case every element is filtered independently.
 """
 
 import math
@@ -29,6 +30,16 @@ class OneEuroFilter:
         return alpha * x + (1.0 - alpha) * x_prev if x_prev is not None else x
 
     # ---------- public API ----------
+    @property
+    def derivative(self):
+        """Smoothed rate of change from the last filter() call (units per second)."""
+        return self._dx_prev
+
+    def reset(self):
+        self._x_prev = None
+        self._dx_prev = 0.0
+        self._t_prev = None
+
     def filter(self, x, t):
         if self._t_prev is None:
             # first call → initialise and return raw value
@@ -1,9 +1,12 @@
 import cv2
+import logging
 import numpy as np
 import time
 import math
 from collections import deque
+from mediapipe.framework.formats import landmark_pb2
 from src.pose.pose_detector import PoseDetector
+from src.preprocess.one_euro import OneEuroFilter
 from src.utils.math_utils import joint_angle
 from src.feedback.enhanced_feedback_manager import EnhancedFeedbackManager
 from src.grading.advanced_form_grader import (
@@ -18,6 +21,10 @@ from src.utils.rep_counter import RepCounter, MovementPhase
 from src.validation.pose_validation import PoseValidationSystem
 from src.data.session_logger import DataLogger
 from enum import Enum
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
 
 class SessionState(Enum):
     """Session state enumeration for robust state management"""
@@ -26,6 +33,21 @@ class SessionState(Enum):
     ACTIVE = "active"
     PAUSED = "paused"
 
+@dataclass(slots=True)
+class ProcessResult:
+    """Per-frame output of PoseProcessor.process_frame for the UI (slotted: read every frame)"""
+    processed_frame: Optional[np.ndarray]
+    rep_count: int = 0
+    phase: str = 'READY'
+    fps: float = 0.0
+    session_state: str = SessionState.STOPPED.value
+    landmarks_detected: bool = False
+    last_rep_analysis: Dict[str, Any] = field(default_factory=dict)
+    feedback: Any = None
+    angles: Dict[str, float] = field(default_factory=dict)
+    tempo: Optional[float] = None
+    knee_angle: Optional[float] = None  # Deeper (smaller) of the two knee angles, in degrees
+
 class PoseProcessor:
     def __init__(self, user_profile: UserProfile = None, threshold_config: ThresholdConfig = None, enable_validation: bool = False):
         self.pose_detector = PoseDetector()
@@ -53,18 +75,52 @@ class PoseProcessor:
         # Validation system (optional for debugging)
         self.enable_validation = enable_validation
         self.validation_system = PoseValidationSystem() if enable_validation else None
+        self._rgb_buffer = None  # Reused BGR->RGB conversion target for inference
 
         self.settings = {
             'show_skeleton': True,
             'show_angles': True,
             'confidence_threshold': 0.7,
             'calibration_required_frames': 90,
+            'mediapipe_model_complexity': self.pose_detector.model_complexity,
+            # 'gpu' runs a PoseLandmarker .task model on the GPU delegate when possible
+            'pose_backend': 'cpu',
+            'pose_gpu_model_path': '',
+            # Re-run the person detector after this many consecutive frames whose
+            # key landmarks fall below the visibility floor (tracker has drifted)
+            'tracking_visibility_floor': 0.5,
+            'redetect_after_frames': 5,
+            # Landmark velocity smoothing for the overlay on frames that skip
+            # inference. Coordinates are normalised (0-1), hence the large beta.
+            'landmark_min_cutoff': 1.0,
+            'landmark_beta': 10.0,
+            'landmark_max_prediction_s': 0.2,
         }
+        self._landmark_filter = OneEuroFilter(
+            min_cutoff=self.settings['landmark_min_cutoff'],
+            beta=self.settings['landmark_beta']
+        )
+        self._landmark_track = None  # (points, velocity, timestamp) from the last inference
         self.reset()
 
+    def update_settings(self, settings: dict):
+        """
+        Applies analysis settings pushed from the GUI.
+        
+        A model change is picked up by the next process_frame call, so the
+        MediaPipe graph is only rebuilt on the thread that runs inference.
+        """
+        self.settings.update(settings)
+
+    def set_validation(self, enabled: bool):
+        """Turns the pose validation system on or off without rebuilding the processor."""
+        self.enable_validation = enabled
+        if enabled and self.validation_system is None:
+            self.validation_system = PoseValidationSystem()
+
     def reset(self):
         """Resets the processor for a new session."""
-        print("🔄 Processor reset for new session.")
+        logger.info("Processor reset for new session.")
         self.rep_counter.reset()
         self.session_manager.reset_session()
         self.form_grader.reset_workout_session()  # Full reset for new workout session
@@ -73,10 +129,13 @@ class PoseProcessor:
         self.last_rep_analysis = {}
         self.previous_metrics = None
         self.frame_counter = 0
-        self.fps = 0
-        self.start_time = time.time()
+        self.fps = 0.0
+        self._last_fps_ns = 0
         self.stability_buffer = deque(maxlen=30)
         self.calibration_frames = 0
+        self._low_visibility_frames = 0
+        self._landmark_filter.reset()
+        self._landmark_track = None
         self._last_phase = None  # For rep transition detection
         self._last_voice_heartbeat = 0.0  # Voice heartbeat timer
         self._voice_debug_enabled = True
@@ -85,27 +144,27 @@ class PoseProcessor:
         self._evaluation_active = False
 
     def _voice_debug(self, message: str):
-        """Prints a standardized voice debug message."""
+        """Logs a standardized voice debug message at DEBUG level."""
         if self._voice_debug_enabled:
-            print(f"[VoiceDebug] {message}")
+            logger.debug("[VoiceDebug] %s", message)
 
     def start_session(self, source_type='webcam'):
         """Starts a new analysis session."""
-        print("🚀 Starting new session...")
+        logger.info("Starting new session...")
         self.reset()
         
         # Start data logging session
         user_id = self.user_profile.user_id if self.user_profile else "default_user"
         session_id = self.data_logger.start_session(user_id)
-        print(f"📊 Data logging session started: {session_id}")
+        logger.info("Data logging session started: %s", session_id)
         
         self.session_manager.start_session()
         if source_type == 'webcam':
             self.session_state = SessionState.CALIBRATING
-            print("✅ Session started - Beginning calibration...")
+            logger.info("Session started - Beginning calibration...")
         else:
             self.session_state = SessionState.ACTIVE
-            print("✅ Session started - Video analysis mode")
+            logger.info("Session started - Video analysis mode")
 
         # Immediate voice system check (direct engine call preferred to bypass cooldowns)
         try:
@@ -129,27 +188,57 @@ class PoseProcessor:
 
     def end_session(self):
         """Ends the current session."""
-        print("🛑 Ending session.")
+        logger.info("Ending session.")
         self.session_state = SessionState.STOPPED
         
         # End data logging session
         self.data_logger.end_session()
-        print("📊 Data logging session ended")
+        logger.info("Data logging session ended")
         
         self.session_manager.end_session()
         # Return session summary instead of calling non-existent method
         return self.session_manager.get_session_summary()
 
-    def process_frame(self, frame):
-        """Processes a single video frame for pose analysis."""
+    def process_frame(self, frame, force_detect=False, display_frame=None):
+        """
+        Processes a single video frame for pose analysis.
+        
+        frame is what the pose model sees and may be downscaled; landmarks are
+        normalised, so the overlay is drawn onto display_frame (full resolution)
+        when given, otherwise onto a copy of frame.
+        
+        MediaPipe tracks the person from the previous frame's landmarks and only
+        runs its detector when tracking is lost. force_detect discards the
+        tracked region first, which also happens automatically once landmark
+        visibility stays low for 'redetect_after_frames' frames.
+        """
         if frame is None or frame.size == 0:
-            print("❌ Invalid frame provided.")
+            logger.warning("Invalid frame provided.")
             return self._get_error_metrics(frame, "Invalid Frame")
 
-        display_frame = frame.copy()
+        if display_frame is None:
+            display_frame = frame.copy()
         self._calculate_fps()
 
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Only calibration and analysis use the pose; skip inference otherwise
+        if self.session_state not in (SessionState.CALIBRATING, SessionState.ACTIVE):
+            return self._get_error_metrics(display_frame, f"Session {self.session_state.value}")
+
+        self.pose_detector.set_model_complexity(
+            int(self.settings.get('mediapipe_model_complexity', 0))
+        )
+        if self.settings.get('pose_backend') == 'gpu':
+            self.pose_detector.set_gpu_model(self.settings.get('pose_gpu_model_path'))
+        else:
+            self.pose_detector.set_gpu_model(None)
+
+        if force_detect or self._low_visibility_frames >= self.settings['redetect_after_frames']:
+            self.pose_detector.reset_tracking()
+            self._low_visibility_frames = 0
+            self._landmark_filter.reset()
+            self._landmark_track = None
+
+        frame_rgb = self._to_rgb(frame)
         pose_results = self.pose_detector.process_frame(frame_rgb)
 
         if not pose_results or not pose_results.pose_landmarks:
@@ -159,6 +248,12 @@ class PoseProcessor:
         self.pose_detector.draw_landmarks(display_frame)
         
         landmarks = pose_results.pose_landmarks.landmark
+        self._track_landmarks(landmarks)
+        visibility = self.pose_detector.calculate_landmark_visibility(landmarks)
+        if visibility < self.settings['tracking_visibility_floor']:
+            self._low_visibility_frames += 1
+        else:
+            self._low_visibility_frames = 0
 
         if self.session_state == SessionState.CALIBRATING:
             return self._handle_calibration(landmarks, display_frame)
@@ -168,20 +263,81 @@ class PoseProcessor:
 
         return self._get_error_metrics(display_frame, f"Unhandled State: {self.session_state.value}")
 
+    def _to_rgb(self, frame):
+        """
+        Converts a BGR frame to RGB in a reused buffer.
+        
+        MediaPipe copies the image into its own packet, so the buffer can be
+        overwritten on the next frame.
+        """
+        if self._rgb_buffer is None or self._rgb_buffer.shape != frame.shape:
+            self._rgb_buffer = np.empty_like(frame)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+
+    def _track_landmarks(self, landmarks):
+        """Feeds landmark positions to the One-Euro filter to estimate their velocity."""
+        now = time.perf_counter()
+        if self._landmark_track is not None and now <= self._landmark_track[2]:
+            return
+        points = self.pose_detector.landmark_array(landmarks)[:, :2].copy()
+        self._landmark_filter.filter(points, now)
+        # Published as one tuple so the GUI thread never sees a half-updated track
+        self._landmark_track = (points, self._landmark_filter.derivative, now)
+
+    def draw_last_pose(self, frame):
+        """
+        Draws the pose onto a frame that skipped inference.
+        
+        Landmarks are extrapolated from the last detection using their smoothed
+        velocity, so the overlay keeps following the movement instead of
+        freezing until the next inference frame.
+        """
+        results = self.pose_detector.results
+        if not results or not results.pose_landmarks:
+            return frame
+
+        track = self._landmark_track
+        if track is None:
+            self.pose_detector.draw_landmarks(frame)
+            return frame
+
+        points, velocity, timestamp = track
+        elapsed = min(time.perf_counter() - timestamp, self.settings['landmark_max_prediction_s'])
+        predicted = points + velocity * elapsed
+
+        pose_landmarks = landmark_pb2.NormalizedLandmarkList()
+        pose_landmarks.CopyFrom(results.pose_landmarks)
+        for landmark, (x, y) in zip(pose_landmarks.landmark, predicted):
+            landmark.x = x
+            landmark.y = y
+        self.pose_detector.draw_landmarks(frame, pose_landmarks)
+        return frame
+
     def _calculate_fps(self):
-        """Calculates the frames per second."""
+        """Updates an exponential moving average of the frame rate."""
         self.frame_counter += 1
-        elapsed_time = time.time() - self.start_time
-        if elapsed_time > 1:
-            self.fps = self.frame_counter / elapsed_time
-            self.frame_counter = 0
-            self.start_time = time.time()
-
-    def _convert_landmarks_to_metrics(self, landmarks, previous_metrics):
-        """Converts raw MediaPipe landmarks to a BiomechanicalMetrics object."""
+        now_ns = time.perf_counter_ns()
+        if self._last_fps_ns:
+            dt_ns = now_ns - self._last_fps_ns
+            if dt_ns > 0:
+                instant_fps = 1e9 / dt_ns
+                if self.fps:
+                    self.fps = 0.9 * self.fps + 0.1 * instant_fps
+                else:
+                    self.fps = instant_fps
+        self._last_fps_ns = now_ns
+
+    def _convert_landmarks_to_metrics(self, landmarks, previous_metrics, angles=None):
+        """
+        Converts raw MediaPipe landmarks to a BiomechanicalMetrics object.
+        
+        angles, when the caller has already computed them for this frame, are
+        reused instead of being calculated a second time.
+        """
         # This function encapsulates the logic we removed from the form grader
         try:
-            angles = self.pose_detector.calculate_angles(landmarks)
+            if angles is None:
+                angles = self.pose_detector.calculate_angles(landmarks)
             com_x, com_y = self.pose_detector.calculate_center_of_mass(landmarks)
             visibility = self.pose_detector.calculate_landmark_visibility(landmarks)
             
@@ -197,7 +353,7 @@ class PoseProcessor:
 
             # FIX: Add validation to ensure we have valid angle data
             if not angles or all(angle == 0 for angle in angles.values()):
-                print("⚠️ Warning: No valid angles calculated from landmarks")
+                logger.debug("No valid angles calculated from landmarks")
                 return None  # Return None instead of default metrics
 
             return BiomechanicalMetrics(
@@ -215,7 +371,7 @@ class PoseProcessor:
                 raw_landmarks=landmarks  # Pass raw landmarks for enhanced analysis
             )
         except Exception as e:
-            print(f"Error creating biomechanical metrics: {e}")
+            logger.error("Error creating biomechanical metrics: %s", e)
             return None  # Return None on error instead of default object
 
     def _handle_active_analysis(self, landmarks, frame):
@@ -225,7 +381,7 @@ class PoseProcessor:
 
         # Voice heartbeat every 12s before first rep to confirm audio pipeline remains alive
         if self.rep_counter.rep_count == 0:
-            now = time.time()
+            now = time.monotonic()
             if now - self._last_voice_heartbeat > 12:
                 try:
                     if hasattr(self.feedback_manager, 'voice_engine') and self.feedback_manager.voice_engine and self.feedback_manager.voice_engine.is_available():
@@ -254,7 +410,8 @@ class PoseProcessor:
         last_phase_enum = getattr(self, '_last_phase_enum', None)
 
         if last_phase_enum != current_phase_enum:
-            print(f"[RepDebug] Phase transition: {last_phase_enum.name if last_phase_enum else 'None'} -> {current_phase_enum.name}")
+            logger.debug("[RepDebug] Phase transition: %s -> %s",
+                         last_phase_enum.name if last_phase_enum else 'None', current_phase_enum.name)
 
         # Rep start detection: leaving STANDING
         if (current_phase_enum != MovementPhase.STANDING and
@@ -262,22 +419,22 @@ class PoseProcessor:
             expected_rep_number = self.rep_counter.rep_count + 1
             try:
                 self.data_logger.log_rep_start(expected_rep_number)
-                print(f"✅ Rep {expected_rep_number} started (phase={current_phase_enum.value})")
+                logger.debug("Rep %d started (phase=%s)", expected_rep_number, current_phase_enum.value)
                 ok_voice = self.feedback_manager.add_intelligent_feedback(
                     fault_type='ENCOURAGEMENT',
                     severity='general',
                     rep_count=expected_rep_number,
                     force_voice=True
                 )
-                print(f"[VoiceDebug] Rep start voice returned {ok_voice}")
+                self._voice_debug(f"Rep start voice returned {ok_voice}")
             except Exception as e:
-                print(f"❌ Error starting rep logging: {e}")
+                logger.error("Error starting rep logging: %s", e)
 
         self._last_phase_enum = current_phase_enum
         
         # Collect metrics for the current rep - SKIP invalid metrics
         if current_phase_enum != MovementPhase.STANDING or self.current_rep_metrics:
-            current_metric = self._convert_landmarks_to_metrics(landmarks, self.previous_metrics)
+            current_metric = self._convert_landmarks_to_metrics(landmarks, self.previous_metrics, angles)
             if current_metric is not None:  # Only add valid metrics
                 self.current_rep_metrics.append(current_metric)
                 self.previous_metrics = current_metric
@@ -294,7 +451,7 @@ class PoseProcessor:
                     # NEW: Automatically log evaluation data during normal processing
                     self._log_evaluation_data_automatically(current_metric, self.pose_detector.results, phase_str)
                 except Exception as e:
-                    print(f"❌ Error logging frame data: {e}")
+                    logger.error("Error logging frame data: %s", e)
 
         # When a rep is completed, trigger the full analysis
         if rep_state.rep_completed:
@@ -302,17 +459,21 @@ class PoseProcessor:
             self.current_rep_metrics = []
             self.previous_metrics = None
 
+        # Deepest knee for the live depth display; 0 means the joint was degenerate
+        knee_angles = [a for a in (angles.get('knee_left', 0), angles.get('knee_right', 0)) if a > 0]
+        
         # Prepare live data for the UI
-        live_results = {
-            'rep_count': self.rep_counter.rep_count,
-            'phase': raw_phase,
-            'fps': self.fps,
-            'session_state': self.session_state.value,
-            'landmarks_detected': True,
-            'processed_frame': frame,
-            'last_rep_analysis': self.last_rep_analysis
-        }
-        return live_results
+        return ProcessResult(
+            processed_frame=frame,
+            rep_count=self.rep_counter.rep_count,
+            phase=raw_phase,
+            fps=self.fps,
+            session_state=self.session_state.value,
+            landmarks_detected=True,
+            last_rep_analysis=self.last_rep_analysis,
+            angles=angles,
+            knee_angle=min(knee_angles) if knee_angles else None
+        )
 
     def _process_completed_rep(self):
         """
@@ -321,31 +482,30 @@ class PoseProcessor:
         """
         try:
             if not self.current_rep_metrics:
-                print("⚠️ Rep completed with no landmark data.")
+                logger.warning("Rep completed with no landmark data.")
                 return
 
             frame_metrics = self.current_rep_metrics
-            print(f"🔄 Processing completed rep {self.rep_counter.rep_count} with {len(frame_metrics)} metrics.")
+            logger.debug("Processing completed rep %d with %d metrics.", self.rep_counter.rep_count, len(frame_metrics))
             
             # Run validation if enabled
             # Reset form grader state for fresh analysis of each rep
             self.form_grader.reset_session_state()
             
             if self.enable_validation and self.validation_system:
-                print(f"\n{'='*60}")
-                print(f"🔍 VALIDATION MODE - Rep {self.rep_counter.rep_count}")
-                print(f"{'='*60}")
-                
                 # Validate the frame metrics
                 validation_results = self.validation_system.validate_rep_analysis(
                     frame_metrics, self.pose_detector, self.form_grader
                 )
                 
-                # Print validation summary
-                print(f"Validation Results:")
-                print(f"- Landmark validation: {'✅ PASS' if validation_results['landmarks']['is_valid'] else '❌ FAIL'}")
-                print(f"- Angle validation: {'✅ PASS' if validation_results['angles']['is_valid'] else '❌ FAIL'}")
-                print(f"- Metrics validation: {'✅ PASS' if validation_results['biomechanics']['is_valid'] else '❌ FAIL'}")
+                # Log validation summary
+                logger.info(
+                    "Validation results for rep %d: landmarks=%s, angles=%s, metrics=%s",
+                    self.rep_counter.rep_count,
+                    'PASS' if validation_results['landmarks']['is_valid'] else 'FAIL',
+                    'PASS' if validation_results['angles']['is_valid'] else 'FAIL',
+                    'PASS' if validation_results['biomechanics']['is_valid'] else 'FAIL',
+                )
                 
                 # Use debug grading if validation is enabled
                 debug_results = self.form_grader.debug_grade_repetition(frame_metrics)
@@ -367,7 +527,7 @@ class PoseProcessor:
             overall_score = self.last_rep_analysis.get('score', 0)
             faults = self.last_rep_analysis.get('faults', [])
             
-            print(f"🔊 Providing voice feedback for rep {rep_count} completion (score: {overall_score})")
+            self._voice_debug(f"Providing voice feedback for rep {rep_count} completion (score: {overall_score})")
             
             # Announce rep completion with encouraging voice
             # Choose severity based on form score
@@ -461,9 +621,7 @@ class PoseProcessor:
                 )
 
         except Exception as e:
-            print(f"⚠️ Error in rep analysis: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in rep analysis: %s", e)
             self.last_rep_analysis = {
                 'score': 0, 
                 'feedback': ['Analysis failed.'],
@@ -480,13 +638,9 @@ class PoseProcessor:
         if len(self.stability_buffer) == self.stability_buffer.maxlen:
             x_var = np.var([pos[0] for pos in self.stability_buffer])
             y_var = np.var([pos[1] for pos in self.stability_buffer])
-            print(f"🔍 DEBUG - Stability check: x_var={x_var:.6f}, y_var={y_var:.6f}")
             # Relaxed thresholds for real-world stability (10x more lenient)
-            if x_var < 0.001 and y_var < 0.001:
-                is_stable = True
-                print(f"🔍 DEBUG - STABLE frame detected!")
-            else:
-                print(f"🔍 DEBUG - Not stable (thresholds: x<0.001, y<0.001)")
+            is_stable = x_var < 0.001 and y_var < 0.001
+            logger.debug("Stability check: x_var=%.6f, y_var=%.6f, stable=%s", x_var, y_var, is_stable)
         
         if is_stable:
             self.calibration_frames += 1
@@ -496,7 +650,7 @@ class PoseProcessor:
         progress = self.calibration_frames / self.settings['calibration_required_frames']
 
         if progress >= 1.0:
-            print("✅ Calibration Complete!")
+            logger.info("Calibration complete.")
             self.session_state = SessionState.ACTIVE
             feedback = ["Ready to start! Begin your first squat."]
         else:
@@ -521,24 +675,24 @@ class PoseProcessor:
                 }
                 self._log_evaluation_data_if_active(eval_metrics, self.pose_detector.results)
             except Exception as e:
-                print(f"❌ Error logging calibration evaluation data: {e}")
+                logger.error("Error logging calibration evaluation data: %s", e)
 
-        return {
-            'rep_count': 0, 'phase': 'CALIBRATING', 'fps': self.fps,
-            'session_state': self.session_state.value, 'landmarks_detected': True,
-            'processed_frame': frame, 'feedback': feedback, 'last_rep_analysis': {}
-        }
+        return ProcessResult(
+            processed_frame=frame, rep_count=0, phase='CALIBRATING', fps=self.fps,
+            session_state=self.session_state.value, landmarks_detected=True,
+            feedback=feedback
+        )
 
     def _get_error_metrics(self, frame, message):
-        """Returns a standard dictionary for error states or no pose."""
+        """Returns a standard result for error states or no pose."""
         # You can draw the error message on the frame here if you want
         cv2.putText(frame, message, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-        return {
-            'rep_count': self.rep_counter.rep_count,
-            'phase': 'ERROR', 'fps': self.fps,
-            'session_state': self.session_state.value, 'landmarks_detected': False,
-            'processed_frame': frame, 'last_rep_analysis': self.last_rep_analysis
-        }
+        return ProcessResult(
+            processed_frame=frame, rep_count=self.rep_counter.rep_count,
+            phase='ERROR', fps=self.fps,
+            session_state=self.session_state.value, landmarks_detected=False,
+            last_rep_analysis=self.last_rep_analysis
+        )
 
     # ========================================
     # AUTOMATIC EVALUATION LOGGING METHODS
@@ -0,0 +1,37 @@
+# ai_fitness_coach/src/utils/fast_json.py
+"""
+Optional orjson support for JSON exports.
+
+``dumps`` serialises with orjson when it is installed (several times faster,
+and NumPy arrays/scalars are written natively) and with the standard library
+``json`` module otherwise. Either way it returns UTF-8 encoded bytes.
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj, indent=None, default=None):
+    """
+    Serialise obj to UTF-8 JSON bytes.
+    Args:
+        indent: pretty-print with a two space indent. None (the default)
+            indents only with orjson; the standard library falls back to
+            its pure-Python encoder whenever indent is set.
+        default: called for objects neither serialiser handles natively.
+    """
+    if indent is None:
+        indent = orjson is not None
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=default,
+                      ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,26 @@
+# ai_fitness_coach/src/utils/jit.py
+"""
+Optional Numba JIT support.
+
+``njit`` compiles with Numba when it is installed and is a no-op decorator
+otherwise, so kernels still run as plain Python without the dependency.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """Drop-in for ``numba.njit`` that falls back to the undecorated function."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func):
+        return func
+    return decorator
@@ -1,6 +1,10 @@
 # ai_fitness_coach/src/utils/math_utils.py
 import math
 
+import numpy as np
+
+from src.utils.jit import njit
+
 
 def joint_angle(ax, ay, bx, by, cx, cy):
     """
@@ -19,3 +23,32 @@ def joint_angle(ax, ay, bx, by, cx, cy):
 
     cos_ang = max(-1.0, min(1.0, dot / norm))
     return math.degrees(math.acos(cos_ang))
+
+
+@njit(cache=True, fastmath=True)
+def joint_angles(points, triplets):
+    """
+    Vectorised joint_angle over many (A, B, C) index triplets.
+    Args:
+        points: float array of shape (N, 2+) with landmark x/y coords in the
+            first two columns (extra columns are ignored).
+        triplets: int array of shape (M, 3) with indices into ``points``.
+    Returns a float64 array of M angles in degrees (0.0 for degenerate joints).
+    """
+    out = np.empty(triplets.shape[0], dtype=np.float64)
+    for i in range(triplets.shape[0]):
+        a, b, c = triplets[i, 0], triplets[i, 1], triplets[i, 2]
+        v1x = points[a, 0] - points[b, 0]
+        v1y = points[a, 1] - points[b, 1]
+        v2x = points[c, 0] - points[b, 0]
+        v2y = points[c, 1] - points[b, 1]
+
+        norm = math.sqrt(v1x * v1x + v1y * v1y) * math.sqrt(v2x * v2x + v2y * v2y)
+        if norm == 0.0:
+            out[i] = 0.0
+            continue
+
+        cos_ang = (v1x * v2x + v1y * v2y) / norm
+        cos_ang = max(-1.0, min(1.0, cos_ang))
+        out[i] = math.degrees(math.acos(cos_ang))
+    return out
@@ -5,11 +5,14 @@ This module provides intelligent repetition counting with phase detection
 and form validation for exercise tracking.
 """
 
+import logging
 import time
 from enum import Enum
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 class MovementPhase(Enum):
     """Movement phases for exercise tracking"""
     STANDING = "standing"
@@ -42,8 +45,8 @@ class RepCounter:
         self.previous_phase = MovementPhase.STANDING
         
         # Phase timing
-        self.phase_start_time = time.time()
-        self.last_phase_change = time.time()
+        self.phase_start_time = time.monotonic()
+        self.last_phase_change = time.monotonic()
         
         # Depth tracking for validation
         self.hit_bottom_this_rep = False
@@ -92,7 +95,7 @@ class RepCounter:
         phase_changed = new_phase != self.current_phase
         
         if phase_changed:
-            print(f"� Phase: {self.current_phase.value} → {new_phase.value} (angle: {primary_angle:.1f}°)")
+            logger.debug("Phase: %s -> %s (angle: %.1f°)", self.current_phase.value, new_phase.value, primary_angle)
             self._handle_phase_transition(new_phase)
         
         # Check for rep completion
@@ -103,10 +106,10 @@ class RepCounter:
             # Validate the rep
             if self.hit_bottom_this_rep:
                 self.rep_count += 1
-                print(f"🎉 REP {self.rep_count} COMPLETED! (min depth: {self.min_knee_angle_this_rep:.1f}°)")
+                logger.info("Rep %d completed (min depth: %.1f°)", self.rep_count, self.min_knee_angle_this_rep)
             else:
                 rep_failed = True
-                print(f"❌ Rep failed - didn't hit bottom (min_angle: {self.min_knee_angle_this_rep:.1f}°)")
+                logger.info("Rep failed - didn't hit bottom (min_angle: %.1f°)", self.min_knee_angle_this_rep)
             
             # Reset for next rep
             self._reset_rep_tracking()
@@ -116,7 +119,7 @@ class RepCounter:
             rep_completed=rep_completed and not rep_failed,
             rep_failed=rep_failed,
             depth_achieved=self.hit_bottom_this_rep,
-            phase_duration=time.time() - self.phase_start_time
+            phase_duration=time.monotonic() - self.phase_start_time
         )
     
     def _detect_phase(self, primary_angle: float) -> MovementPhase:
@@ -154,10 +157,9 @@ class RepCounter:
         """Handle transition between movement phases"""
         self.previous_phase = self.current_phase
         self.current_phase = new_phase
-        self.last_phase_change = time.time()
-        self.phase_start_time = time.time()
-        
-        print(f"Phase transition: {self.previous_phase.value} → {new_phase.value}")
+        self.last_phase_change = time.monotonic()
+        self.phase_start_time = time.monotonic()
+
     
     def _check_rep_completion(self, current_phase: MovementPhase) -> bool:
         """Check if a repetition has been completed"""
@@ -171,19 +173,18 @@ class RepCounter:
         """Reset tracking variables for the next repetition"""
         self.hit_bottom_this_rep = False
         self.min_knee_angle_this_rep = 180.0
-        self.phase_start_time = time.time()
+        self.phase_start_time = time.monotonic()
     
     def reset(self):
         """Reset the entire counter for a new session"""
         self.rep_count = 0
         self.current_phase = MovementPhase.STANDING
         self.previous_phase = MovementPhase.STANDING
-        self.phase_start_time = time.time()
-        self.last_phase_change = time.time()
+        self.phase_start_time = time.monotonic()
+        self.last_phase_change = time.monotonic()
         self._reset_rep_tracking()
         self.phase_history.clear()
-        
-        print("🔄 RepCounter reset for new session")
+        logger.debug("RepCounter reset for new session")
     
     def get_stats(self) -> Dict[str, any]:
         """Get current statistics"""
@@ -192,5 +193,5 @@ class RepCounter:
             'current_phase': self.current_phase.value,
             'hit_bottom_this_rep': self.hit_bottom_this_rep,
             'min_angle_this_rep': self.min_knee_angle_this_rep,
-            'phase_duration': time.time() - self.phase_start_time
+            'phase_duration': time.monotonic() - self.phase_start_time
         }
@@ -0,0 +1,16 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication for the whole run; widgets need it and worker threads need an app."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    elif not isinstance(app, QtWidgets.QApplication):
+        pytest.fail(f"A {type(app).__name__} was created outside the qapp fixture; widgets need a QApplication")
+    return app
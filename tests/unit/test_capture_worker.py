@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+from PySide6.QtCore import Qt
+
+from src.gui.capture_worker import CaptureWorker
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+class FakeCamera:
+    def __init__(self, frames, is_video_file=False):
+        self.frames = list(frames)
+        self.is_video_file = is_video_file
+        self.out_args = []
+        self._lock = threading.Lock()
+
+    def grab_and_retrieve(self, skip, out=None):
+        with self._lock:
+            self.out_args.append(out)
+            return self.frames.pop(0) if self.frames else None
+
+    @property
+    def grab_count(self):
+        with self._lock:
+            return len(self.out_args)
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_live_mode_keeps_the_newest_frame_and_recycles_the_rest():
+    f1, f2, f3 = object(), object(), object()
+    camera = FakeCamera([f1, f2, f3])
+    worker = CaptureWorker(camera)
+    ready, ended = [], []
+    worker.frameReady.connect(lambda: ready.append(True), Qt.DirectConnection)
+    worker.sourceEnded.connect(lambda: ended.append(True), Qt.DirectConnection)
+
+    worker.run()  # Live sources never block, so the loop can run on this thread
+
+    assert ready == [True]  # Only the empty-to-full transition notifies
+    assert ended == [True]
+    assert worker.source_ended
+    assert worker.take_latest() is f3
+    assert worker.take_latest() is None
+    # Overwritten frames went back to the pool and were decoded into again
+    assert camera.out_args[:3] == [None, None, f1]
+
+
+def test_recycled_frames_are_reused_as_decode_buffers():
+    buffer = object()
+    camera = FakeCamera([object()])
+    worker = CaptureWorker(camera)
+    worker.recycle(None)
+    worker.recycle(buffer)
+
+    worker.run()
+
+    assert camera.out_args[0] is buffer
+    assert camera.out_args[1] is None
+
+
+def test_recycled_pool_is_bounded():
+    camera = FakeCamera([])
+    worker = CaptureWorker(camera)
+    for _ in range(CaptureWorker.MAX_POOLED_FRAMES + 2):
+        worker.recycle(object())
+
+    assert len(worker._free_buffers) == CaptureWorker.MAX_POOLED_FRAMES
+
+
+def test_video_mode_waits_for_each_frame_to_be_taken():
+    frames = [object() for _ in range(4)]
+    camera = FakeCamera(frames, is_video_file=True)
+    worker = CaptureWorker(camera)
+    ended = threading.Event()
+    worker.sourceEnded.connect(ended.set, Qt.DirectConnection)
+    worker.start()
+    try:
+        taken = []
+        while len(taken) < len(frames):
+            assert wait_until(lambda: worker._latest is not None)
+            # The slot is full: the worker may read one frame ahead, then blocks
+            grabs = camera.grab_count
+            time.sleep(0.05)
+            assert camera.grab_count == grabs
+            assert camera.grab_count <= len(taken) + 2
+            taken.append(worker.take_latest())
+
+        assert taken == frames  # No frame of the recording was skipped
+        assert ended.wait(2.0)
+        assert worker.source_ended
+        assert worker.take_latest() is None
+    finally:
+        worker.stop()
+
+
+def test_stop_releases_a_blocked_video_worker():
+    camera = FakeCamera([object(), object()], is_video_file=True)
+    worker = CaptureWorker(camera)
+    worker.start()
+    assert wait_until(lambda: camera.grab_count == 2)
+
+    worker.stop()
+
+    assert worker.isFinished()
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from src.config.config_manager import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return ConfigManager()
+
+
+def test_load_config_returns_isolated_copies(manager):
+    config = manager.load_config()
+    config["analysis_settings"]["skip_frames_base"] = 99
+    config["ui_settings"]["window_width"] = 1
+
+    fresh = manager.load_config()
+
+    assert fresh["analysis_settings"]["skip_frames_base"] == manager.default_config["analysis_settings"]["skip_frames_base"]
+    assert fresh["ui_settings"]["window_width"] == manager.default_config["ui_settings"]["window_width"]
+    assert manager.default_config["analysis_settings"]["skip_frames_base"] != 99
+
+
+def test_saved_config_is_not_aliased_by_the_cache(manager):
+    config = manager.load_config()
+    config["analysis_settings"]["inference_max_side"] = 320
+    manager.save_config(config)
+
+    config["analysis_settings"]["inference_max_side"] = 1
+
+    assert manager.load_config()["analysis_settings"]["inference_max_side"] == 320
+
+
+def test_load_after_save_sees_the_new_values(manager):
+    manager.update_analysis_settings({"video_analysis_fps": 15})
+
+    assert manager.get_analysis_settings()["video_analysis_fps"] == 15
+    assert ConfigManager().get_analysis_settings()["video_analysis_fps"] == 15
+
+
+def test_config_file_is_parsed_once(manager, monkeypatch):
+    manager.load_config()
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("config file re-read")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    assert manager.load_config()["analysis_settings"]
+
+
+def test_unreadable_config_falls_back_to_isolated_defaults(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config_file = tmp_path / ".ai_fitness_coach" / "config.json"
+    config_file.parent.mkdir()
+    config_file.write_text("{not json")
+    manager = ConfigManager()
+
+    config = manager.load_config()
+    config["analysis_settings"]["skip_frames_base"] = 99
+
+    assert manager.default_config["analysis_settings"]["skip_frames_base"] != 99
+
+
+def test_unchanged_ui_settings_are_not_rewritten(manager, monkeypatch):
+    assert manager.save_ui_settings({"window_width": 1200, "window_height": 800})
+    saved = manager.config_file.read_text()
+
+    def fail_save(config):
+        raise AssertionError("unchanged UI settings rewritten")
+
+    monkeypatch.setattr(manager, "save_config", fail_save)
+    assert manager.save_ui_settings({"window_width": 1200, "window_height": 800})
+
+    assert manager.config_file.read_text() == saved
+    assert json.loads(saved)["ui"] == {"window_width": "1200", "window_height": "800"}
+
+
+def test_changed_ui_settings_are_written(manager):
+    manager.save_ui_settings({"window_width": 1200, "window_height": 800})
+    manager.save_ui_settings({"window_width": 1300, "window_height": 800})
+
+    assert json.loads(manager.config_file.read_text())["ui"]["window_width"] == "1300"
+    assert manager.load_config()["ui"]["window_width"] == "1300"
@@ -0,0 +1,73 @@
+import json
+from collections import deque
+
+import pytest
+
+from src.utils import fast_json
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    monkeypatch.setattr(fast_json, "orjson", None)
+
+
+SAMPLE = {"exercise": "squat", "note": "Großartig — 👍", "scores": [88.5, 91, 70], "nested": {"reps": 3}}
+
+
+def test_stdlib_fallback_returns_utf8_bytes(stdlib_json):
+    data = fast_json.dumps(SAMPLE)
+
+    assert isinstance(data, bytes)
+    assert "Großartig — 👍" in data.decode("utf-8")
+    assert json.loads(data) == SAMPLE
+
+
+def test_stdlib_fallback_matches_orjson_shape():
+    pytest.importorskip("orjson")
+    with_orjson = fast_json.dumps(SAMPLE, indent=True)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(fast_json, "orjson", None)
+        without_orjson = fast_json.dumps(SAMPLE, indent=True)
+
+    assert json.loads(with_orjson) == json.loads(without_orjson)
+    assert with_orjson.decode("utf-8") == without_orjson.decode("utf-8")
+
+
+def test_indent_default_depends_on_backend(stdlib_json):
+    assert b"\n" not in fast_json.dumps(SAMPLE)
+    assert b"\n  " in fast_json.dumps(SAMPLE, indent=True)
+
+
+def test_indent_default_with_orjson():
+    pytest.importorskip("orjson")
+
+    assert b"\n  " in fast_json.dumps(SAMPLE)
+    assert b"\n" not in fast_json.dumps(SAMPLE, indent=False)
+
+
+def test_default_hook_is_used_by_stdlib_fallback(stdlib_json):
+    data = fast_json.dumps({"tags": {"b", "a"}}, default=sorted)
+
+    assert json.loads(data) == {"tags": ["a", "b"]}
+    with pytest.raises(TypeError):
+        fast_json.dumps({"tags": {"a"}})
+
+
+def test_session_report_hook_handles_sets_and_deques(stdlib_json):
+    pytest.importorskip("PySide6")
+    from src.gui.widgets.session_report import _json_default
+
+    data = fast_json.dumps({"tags": {"b", "a"}, "recent": deque([1, 2], maxlen=5)}, default=_json_default)
+
+    assert json.loads(data) == {"tags": ["a", "b"], "recent": [1, 2]}
+
+
+def test_session_report_hook_handles_numpy_values(stdlib_json):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("PySide6")
+    from src.gui.widgets.session_report import _json_default
+
+    obj = {"score": np.float32(87.5), "reps": np.int64(12), "angles": np.array([[90.0, 45.5]])}
+    data = fast_json.dumps(obj, default=_json_default)
+
+    assert json.loads(data) == {"score": 87.5, "reps": 12, "angles": [[90.0, 45.5]]}
@@ -0,0 +1,188 @@
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("PySide6")
+from PySide6.QtCore import Qt
+
+from src.gui.inference_worker import InferenceWorker
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+class FakeProcessor:
+    """Records each frame; blocks until released, and raises for frames flagged to fail."""
+
+    def __init__(self, block=False, fail_first=False):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self.fail_first = fail_first
+
+    def process_frame(self, frame, force_detect=False, display_frame=None):
+        self.calls.append((frame, force_detect, display_frame))
+        self.started.set()
+        self.release.wait(2.0)
+        if self.fail_first and len(self.calls) == 1:
+            raise ValueError("bad frame")
+        return ("result", display_frame)
+
+
+def make_frame(value=0):
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def test_submit_replaces_the_waiting_frame_and_returns_its_display_frame():
+    worker = InferenceWorker(FakeProcessor())
+    d1, d2 = make_frame(1), make_frame(2)
+
+    assert worker.is_idle()
+    assert worker.submit(make_frame(), display_frame=d1) is None
+    assert worker.submit(make_frame(), display_frame=d2) is d1
+    assert worker.submit(make_frame()) is d2
+    assert worker.has_pending()
+    assert not worker.is_idle()
+
+
+def test_pending_and_idle_across_one_cycle():
+    processor = FakeProcessor(block=True)
+    worker = InferenceWorker(processor)
+    results = []
+    idle_in_slot = []
+    done = threading.Event()
+
+    def on_result(result, elapsed):
+        results.append((result, elapsed))
+        idle_in_slot.append(worker.is_idle())
+        done.set()
+
+    worker.resultReady.connect(on_result, Qt.DirectConnection)
+    worker.start()
+    try:
+        display = make_frame(7)
+        worker.submit(make_frame(), display_frame=display, force_detect=True)
+        assert processor.started.wait(2.0)
+
+        # Picked up but still running
+        assert not worker.has_pending()
+        assert not worker.is_idle()
+
+        processor.release.set()
+        assert done.wait(2.0)
+        assert idle_in_slot == [True]
+        assert results[0][0] == ("result", display)
+        assert results[0][1] >= 0
+        assert processor.calls[0][1] is True
+        assert processor.calls[0][2] is display
+    finally:
+        worker.stop()
+
+
+def test_error_is_reported_and_the_next_frame_still_runs():
+    processor = FakeProcessor(fail_first=True)
+    worker = InferenceWorker(processor)
+    errors, results = [], []
+    idle_on_error = []
+    got_error, got_result = threading.Event(), threading.Event()
+
+    def on_error(message):
+        errors.append(message)
+        idle_on_error.append(worker.is_idle())
+        got_error.set()
+
+    def on_result(result, elapsed):
+        results.append(result)
+        got_result.set()
+
+    worker.errorOccurred.connect(on_error, Qt.DirectConnection)
+    worker.resultReady.connect(on_result, Qt.DirectConnection)
+    worker.start()
+    try:
+        worker.submit(make_frame())
+        assert got_error.wait(2.0)
+        assert errors == ["Pose inference error: bad frame"]
+        assert idle_on_error == [True]
+
+        display = make_frame(3)
+        worker.submit(make_frame(), display_frame=display)
+        assert got_result.wait(2.0)
+        assert results == [("result", display)]
+        assert worker.isRunning()
+    finally:
+        worker.stop()
+
+
+def test_downscale_reuses_the_scratch_buffer():
+    worker = InferenceWorker(FakeProcessor(), max_side=8)
+    small = make_frame()
+    assert worker._downscale(small) is small
+
+    first = worker._downscale(np.zeros((16, 32, 3), dtype=np.uint8))
+    second = worker._downscale(np.ones((16, 32, 3), dtype=np.uint8))
+
+    assert first.shape == (4, 8, 3)
+    assert second is first
+
+
+def test_changes_wait_for_the_frame_in_progress():
+    processor = FakeProcessor(block=True)
+    worker = InferenceWorker(processor)
+    applied = threading.Event()
+    worker.start()
+    try:
+        worker.submit(make_frame())
+        assert processor.started.wait(2.0)
+
+        worker.call_between_frames(applied.set)
+        assert not applied.wait(0.05)  # Not while process_frame is running
+
+        processor.release.set()
+        assert applied.wait(2.0)
+    finally:
+        worker.stop()
+
+
+def test_changes_apply_before_the_next_frame():
+    order = []
+    processor = FakeProcessor()
+    processor.process_frame = lambda frame, **kwargs: order.append("frame")
+    worker = InferenceWorker(processor)
+    done = threading.Event()
+    worker.resultReady.connect(lambda result, elapsed: done.set(), Qt.DirectConnection)
+    worker.start()
+    try:
+        worker.call_between_frames(lambda: order.append("change"))
+        worker.submit(make_frame())
+        assert done.wait(2.0)
+        assert order == ["change", "frame"]
+    finally:
+        worker.stop()
+
+
+def test_changes_run_immediately_when_the_worker_is_not_running():
+    worker = InferenceWorker(FakeProcessor())
+    applied = []
+
+    worker.call_between_frames(lambda: applied.append("before start"))
+    worker.start()
+    worker.stop()
+    worker.call_between_frames(lambda: applied.append("after stop"))
+
+    assert applied == ["before start", "after stop"]
+
+
+def test_a_failing_change_does_not_stop_the_worker():
+    worker = InferenceWorker(FakeProcessor())
+    done = threading.Event()
+    worker.resultReady.connect(lambda result, elapsed: done.set(), Qt.DirectConnection)
+    worker.start()
+    try:
+        worker.call_between_frames(lambda: 1 / 0)
+        worker.submit(make_frame())
+        assert done.wait(2.0)
+    finally:
+        worker.stop()
@@ -0,0 +1,22 @@
+import numpy as np
+
+from src.utils.math_utils import joint_angle, joint_angles
+
+
+def test_joint_angles_matches_scalar_joint_angle():
+    rng = np.random.default_rng(0)
+    points = rng.random((33, 2))
+    triplets = np.array([(23, 25, 27), (24, 26, 28), (11, 23, 25)], dtype=np.int64)
+
+    batch = joint_angles(points, triplets)
+
+    for angle, (a, b, c) in zip(batch, triplets):
+        expected = joint_angle(*points[a], *points[b], *points[c])
+        assert abs(angle - expected) < 1e-6
+
+
+def test_joint_angles_degenerate_joint_is_zero():
+    points = np.zeros((3, 2))
+    triplets = np.array([(0, 1, 2)], dtype=np.int64)
+
+    assert joint_angles(points, triplets)[0] == 0.0
@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.gui.widgets.session_report import SessionManager, SessionReportDialog
+
+SCORES = [95, 72, 64, 90, 89.5, 70, 100, 50]
+
+
+def record_reps(manager, scores):
+    for rep, score in enumerate(scores, start=1):
+        manager.update_session(rep_count=rep, form_score=score)
+
+
+def direct_summary(scores):
+    return {
+        'avg_form_score': sum(scores) / len(scores) if scores else 0,
+        'best_form_score': max(scores, default=0),
+        'worst_form_score': min(scores, default=0),
+        'form_score_distribution': {
+            'excellent': sum(1 for s in scores if s >= 90),
+            'good': sum(1 for s in scores if 70 <= s < 90),
+            'needs_work': sum(1 for s in scores if s < 70),
+        },
+    }
+
+
+def test_running_aggregates_match_a_direct_computation():
+    manager = SessionManager()
+    record_reps(manager, SCORES)
+
+    summary = manager.get_session_summary()
+
+    assert summary['form_scores'] == SCORES
+    expected = direct_summary(SCORES)
+    assert summary['avg_form_score'] == pytest.approx(expected['avg_form_score'])
+    for key in ('best_form_score', 'worst_form_score', 'form_score_distribution'):
+        assert summary[key] == expected[key]
+
+
+def test_scores_are_only_recorded_when_the_rep_count_rises():
+    manager = SessionManager()
+    manager.update_session(rep_count=1, form_score=80)
+    manager.update_session(rep_count=1, form_score=10)  # Same rep, not a new score
+
+    summary = manager.get_session_summary()
+
+    assert summary['form_scores'] == [80]
+    assert summary['worst_form_score'] == 80
+
+
+def test_empty_session_summary():
+    summary = SessionManager().get_session_summary()
+
+    assert summary['form_scores'] == []
+    assert summary['avg_form_score'] == 0
+    assert summary['best_form_score'] == 0
+    assert summary['worst_form_score'] == 0
+    assert summary['form_score_distribution'] == {'excellent': 0, 'good': 0, 'needs_work': 0}
+
+
+def test_reset_clears_the_aggregates():
+    manager = SessionManager()
+    record_reps(manager, SCORES)
+    manager.reset_session()
+    record_reps(manager, [60, 75])
+
+    summary = manager.get_session_summary()
+
+    expected = direct_summary([60, 75])
+    assert summary['avg_form_score'] == pytest.approx(expected['avg_form_score'])
+    assert summary['best_form_score'] == 75
+    assert summary['worst_form_score'] == 60
+    assert summary['form_score_distribution'] == expected['form_score_distribution']
+
+
+def test_summary_distribution_is_a_copy():
+    manager = SessionManager()
+    record_reps(manager, SCORES)
+    manager.get_session_summary()['form_score_distribution']['excellent'] = 0
+
+    assert manager.get_session_summary()['form_score_distribution']['excellent'] == 3
+
+
+def test_dialog_falls_back_for_summaries_without_the_new_keys(qapp):
+    manager = SessionManager()
+    record_reps(manager, SCORES)
+    summary = manager.get_session_summary()
+    legacy = {k: v for k, v in summary.items()
+              if k not in ('worst_form_score', 'form_score_distribution')}
+
+    current_dialog = SessionReportDialog(summary)
+    legacy_dialog = SessionReportDialog(legacy)
+
+    assert legacy_dialog.performance_text.toPlainText() == current_dialog.performance_text.toPlainText()
+    assert legacy_dialog.quality_text.toPlainText() == current_dialog.quality_text.toPlainText()
+    assert "Excellent form (90%+): 3 frames" in legacy_dialog.quality_text.toPlainText()